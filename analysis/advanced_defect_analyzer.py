@@ -1,321 +1,600 @@
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
 from collections import Counter, defaultdict
-from sklearn.cluster import KMeans
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import glob
+import hashlib
+import heapq
 import logging
+import os
+import re
+import time
+from config import KOREAN_STOP_WORDS, teams_config
 from utils.logger import flush_log
 from datetime import datetime
+from functools import cached_property, lru_cache
+from itertools import chain
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # numba가 없으면 numpy 행렬곱 경로만 사용 (선택적 의존성)
+    NUMBA_AVAILABLE = False
+
+try:
+    import pyarrow  # noqa: F401
+
+    PARQUET_AVAILABLE = True
+except ImportError:
+    # pyarrow가 없으면 Teams 데이터 로컬 캐시 없이 매번 다운로드 (선택적 의존성)
+    PARQUET_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# 이 열 수를 넘는 상관행렬은 numba 커널로 계산
+NUMBA_CORR_MIN_COLUMNS = 64
+
+# 제안 정렬용 긴급도 순위 (낮을수록 우선)
+URGENCY_RANK = {"IMMEDIATE": 0, "URGENT": 1, "NORMAL": 2}
+
+# 예측 불량률 위험도 구간 (경계값 이상이면 다음 등급)
+RISK_LEVEL_THRESHOLDS = np.array([1, 5, 15])
+RISK_LEVEL_LABELS = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+
+# 불량 패턴 점유율(%) 위험도 구간 (경계값 이상이면 다음 등급)
+PATTERN_RISK_THRESHOLDS = np.array([2, 5])
+PATTERN_RISK_LABELS = ("LOW", "MEDIUM", "HIGH")
+
+# 재질 관련 키워드 분류 기준 (소문자)
+MATERIAL_KEYWORDS = ("pfa", "teflon", "우레탄", "ring")
+
+# 불량 패턴 키워드 토큰 (한글/영문/숫자 연속, O-Ring 같은 하이픈 연결 단어 포함) 및 불용어
+KEYWORD_TOKEN_PATTERN = re.compile(r"[가-힣A-Za-z0-9]+(?:-[가-힣A-Za-z0-9]+)*")
+KEYWORD_STOP_WORDS = frozenset(KOREAN_STOP_WORDS)
+
+# 키워드 언어 판별용 문자 클래스
+UPPERCASE_PATTERN = re.compile(r"[A-Z]")
+HANGUL_PATTERN = re.compile(r"[\uac00-\ud7a3]")
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True)
+    def _corr_abs_mean_numba(matrix):
+        """열 간 상관계수 절댓값 평균을 중간 행렬 없이 한 번에 계산"""
+        n_rows, n_cols = matrix.shape
+        normalized = np.empty((n_rows, n_cols), dtype=np.float64)
+        valid = np.zeros(n_cols, dtype=np.bool_)
+
+        # 열별 평균 제거 후 단위 노름으로 정규화
+        for j in prange(n_cols):
+            mean = 0.0
+            for i in range(n_rows):
+                mean += matrix[i, j]
+            mean /= n_rows
+            norm = 0.0
+            for i in range(n_rows):
+                value = matrix[i, j] - mean
+                normalized[i, j] = value
+                norm += value * value
+            if norm > 0:
+                valid[j] = True
+                norm = np.sqrt(norm)
+                for i in range(n_rows):
+                    normalized[i, j] /= norm
+
+        # 유효한 열 쌍의 |내적| 누적
+        row_sums = np.zeros(n_cols, dtype=np.float64)
+        for a in prange(n_cols):
+            if not valid[a]:
+                continue
+            acc = 0.0
+            for b in range(n_cols):
+                if not valid[b]:
+                    continue
+                dot = 0.0
+                for i in range(n_rows):
+                    dot += normalized[i, a] * normalized[i, b]
+                acc += abs(dot)
+            row_sums[a] = acc
+
+        n_valid = valid.sum()
+        if n_valid == 0:
+            return np.nan
+        return row_sums.sum() / (n_valid * n_valid)
+
+
+def _freeze_lists(value: Any) -> Any:
+    """중첩된 list를 tuple로 변환 (공유 참조 데이터가 호출 측에서 수정되지 않도록)"""
+    if isinstance(value, dict):
+        return {key: _freeze_lists(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return tuple(_freeze_lists(item) for item in value)
+    return value
+
+
+# 개선 방안 데이터베이스 (모든 인스턴스가 공유하는 참조 데이터, 목록은 tuple로 고정)
+_IMPROVEMENT_DB: Dict[str, Dict] = _freeze_lists({
+    # 기존 부품들
+    "CENTER O-RING": {
+        "common_causes": ["가압 불량", "삽입 불량", "누수"],
+        "specific_actions": [
+            "O-링 규격 재검토 및 공차 관리 강화",
+            "조립 시 O-링 손상 방지를 위한 작업자 교육",
+            "가압 테스트 압력 단계별 조정",
+            "O-링 설치 전 청결도 검사 강화",
+        ],
+        "inspection_points": ["O-링 표면 상태", "삽입 깊이", "가압 시 누수점"],
+        "priority_level": "HIGH",
+    },
+    # 실제 데이터 기반 부품들 (오늘 학습 데이터 반영)
+    "SPEED CONTROLLER": {
+        "common_causes": [
+            "Speed Controller Leak (92건 - 최다발생)",
+            "PFA 재질 누수 (72건)",
+            "우레탄 재질 누수 (40건)",
+            "Body 재질 leak",
+            "He 가압검사 불합격",
+        ],
+        "specific_actions": [
+            "Speed Controller 전체 교체 (미보증 부품 우선)",
+            "PFA 재질 누수 근본원인 분석 및 대책 수립",
+            "우레탄 재질 품질 기준 강화",
+            "가압검사 압력 및 시간 최적화",
+            "공급업체 품질 관리",
+        ],
+        "inspection_points": [
+            "Speed Controller Leak 테스트 (필수)",
+            "PFA 재질 내압 성능",
+            "우레탄 재질 밀착도",
+            "Body 재질 crack 검사",
+            "He leak 테스트 기준 준수",
+        ],
+        "priority_level": "CRITICAL",  # 최다발생으로 CRITICAL 상향
+        "enhanced_keywords": ["Speed Controller Leak", "PFA", "우레탄", "Body", "LEAK"],
+        "defect_rate_trend": "증가 (전체 18.3% 차지)",
+    },
+    "HEATING JACKET": {
+        "common_causes": ["온도 제어 불량", "절연 손상", "히터 소손"],
+        "specific_actions": [
+            "온도 센서 교정 및 점검",
+            "히터 저항값 측정 및 교체",
+            "절연 상태 점검 강화",
+            "온도 제어 알고리즘 최적화",
+        ],
+        "inspection_points": ["온도 정확도", "절연 저항", "히터 상태"],
+        "priority_level": "HIGH",
+    },
+    "LEAK SENSOR": {
+        "common_causes": ["센서 감도 불량", "오염", "신호 노이즈"],
+        "specific_actions": [
+            "센서 감도 재조정",
+            "센서 청소 및 보호 강화",
+            "신호 필터링 개선",
+            "센서 위치 최적화",
+        ],
+        "inspection_points": ["감도 설정", "센서 청결도", "신호 품질"],
+        "priority_level": "MEDIUM",
+    },
+    "TOUCH SCREEN": {
+        "common_causes": ["터치 감도 불량", "화면 손상", "통신 오류"],
+        "specific_actions": [
+            "터치 스크린 캘리브레이션",
+            "화면 보호 필름 점검",
+            "통신 케이블 연결 상태 확인",
+            "HMI 소프트웨어 업데이트",
+        ],
+        "inspection_points": ["터치 반응", "화면 상태", "통신 연결"],
+        "priority_level": "MEDIUM",
+    },
+    "FEMALE CONNECTOR": {
+        "common_causes": ["접촉 불량", "삽입 불량", "부식"],
+        "specific_actions": [
+            "커넥터 핀 접촉 압력 조정",
+            "삽입 가이드 정렬 점검",
+            "방청 처리 및 보관 환경 개선",
+            "커넥터 하우징 교체",
+        ],
+        "inspection_points": ["접촉 저항", "삽입력", "부식 상태"],
+        "priority_level": "MEDIUM",
+    },
+    "REDUCER DOUBLE Y UNION": {
+        "common_causes": [
+            "삽입부 불량 (41건 - 최다 키워드)", 
+            "N2 REDUCING DOUBLE Y UNION Leak (12건)",
+            "우레탄 재질 문제",
+            "체결 불량", 
+            "누설"
+        ],
+        "specific_actions": [
+            "삽입부 설계 및 가공 정밀도 개선",
+            "N2 REDUCING DOUBLE Y UNION 누수 방지 대책",
+            "우레탄 재질 품질 기준 강화",
+            "체결 토크 표준화",
+            "조립 순서 및 방법 표준화",
+        ],
+        "inspection_points": [
+            "삽입부 치수 정밀도 (필수)",
+            "N2 REDUCING Leak 테스트",
+            "우레탄 재질 상태 점검",
+            "체결 토크 측정",
+        ],
+        "priority_level": "HIGH",  # 28건으로 HIGH 상향
+        "enhanced_keywords": ["삽입부", "N2 REDUCING DOUBLE Y UNION", "Leak", "우레탄", "LEAK"],
+        "defect_rate_trend": "중간 (전체 5.2% 차지)",
+    },
+    "O-RING": {
+        "common_causes": [
+            "Ring 변형 (21건)",
+            "조립 불량 (15건)",
+            "Ring 재질 문제",
+            "가압 불량",
+            "삽입 불량"
+        ],
+        "specific_actions": [
+            "O-Ring 변형 방지 취급 지침 수립",
+            "조립 공정 표준화 및 작업자 교육",
+            "O-Ring 재질 및 규격 재검토",
+            "가압 테스트 조건 최적화",
+            "삽입 시 손상 방지 도구 개발",
+        ],
+        "inspection_points": [
+            "O-Ring 변형 상태 검사",
+            "조립 정확성 확인",
+            "Ring 재질 규격 적합성",
+            "가압 누설 테스트",
+        ],
+        "priority_level": "MEDIUM",
+        "enhanced_keywords": ["Ring", "조립", "불량", "변형", "RING"],
+        "defect_rate_trend": "낮음 (전체 3.5% 차지)",
+    },
+    "UNION TEE": {
+        "common_causes": ["체결 불량", "나사산 불량", "밀착 불량"],
+        "specific_actions": [
+            "나사산 규격 및 체결 토크 표준화",
+            "체결 순서 및 방법 작업지침서 재정비",
+            "유니온티 가공 정밀도 향상",
+            "밀착면 청소 및 실링 재료 검토",
+        ],
+        "inspection_points": ["나사산 상태", "체결 토크", "밀착면 평활도"],
+        "priority_level": "MEDIUM",
+    },
+    "HEATING PAB PIPE": {
+        "common_causes": ["용접 불량", "열변형", "재질 불량"],
+        "specific_actions": [
+            "용접 조건 최적화 및 작업자 기능 향상",
+            "열처리 공정 온도 및 시간 재검토",
+            "파이프 재질 규격 검증",
+            "용접 후 비파괴검사 강화",
+        ],
+        "inspection_points": ["용접 품질", "치수 정밀도", "내압 성능"],
+        "priority_level": "HIGH",
+    },
+    "MALE ADAPTER": {
+        "common_causes": ["가공 정밀도", "삽입 불량", "체결 불량"],
+        "specific_actions": [
+            "가공 치수 정밀도 향상 및 검사 기준 강화",
+            "삽입 시 정렬 가이드 도구 개발",
+            "어댑터 표면 처리 개선",
+            "조립 공정 표준화",
+        ],
+        "inspection_points": ["치수 정밀도", "표면 조도", "삽입 저항"],
+        "priority_level": "MEDIUM",
+    },
+    "MALE CONNECTOR": {
+        "common_causes": [
+            "MALE CONNECTOR Fitting nut Water Leak (17건)",
+            "N2 Male Connector Teflon 부족 (부품누락)",
+            "PCW Flow Sensor 관련 불량",
+            "Fitting 체결 불량",
+            "Teflon 작업 불량",
+        ],
+        "specific_actions": [
+            "MALE CONNECTOR Fitting nut 누수 근본원인 분석",
+            "Teflon 부족 현상 방지를 위한 재고 관리 강화",
+            "PCW Flow Sensor 연결부 검사 표준화",
+            "Fitting nut 체결 토크 표준화",
+            "Teflon 테이프 감기 작업 지침서 개정",
+        ],
+        "inspection_points": [
+            "MALE CONNECTOR Water Leak 테스트",
+            "Teflon 재료 충분성 확인",
+            "PCW Flow Sensor 연결 상태",
+            "Fitting nut 체결 토크",
+        ],
+        "priority_level": "HIGH",  # 40건으로 HIGH 상향
+        "enhanced_keywords": ["MALE CONNECTOR Fitting nut Water Leak", "부족", "N2 Male Connector Teflon", "PCW Flow Sensor"],
+        "defect_rate_trend": "중간 (전체 7.4% 차지)",
+    },
+    # 실제 데이터 기반 부품들 추가
+    "BURNER SCRAPER LINE-01": {
+        "common_causes": ["Pipe Tee 배관 Crack", "Leak 발생"],
+        "specific_actions": [
+            "Pipe Tee 배관 교체",
+            "Crack 발생 원인 분석",
+            "배관 재질 검토",
+            "설치 공정 개선",
+        ],
+        "inspection_points": ["배관 Crack 상태", "Leak 테스트", "배관 재질"],
+        "priority_level": "HIGH",
+    },
+    "MALE ELBOW": {
+        "common_causes": [
+            "MALE ELBOW Fitting nut Water Leak (40건 - 높은 빈도)",
+            "BCW Jaco Fitting Nut Leak (10건)",
+            "TEFLON 부족 (15건)",
+            "체결 불량",
+            "부품 누락",
+        ],
+        "specific_actions": [
+            "MALE ELBOW Fitting nut 누수 패턴 분석 및 대책",
+            "BCW Jaco Fitting Nut 교체 기준 수립",
+            "TEFLON 재료 충분성 확보 방안",
+            "체결 토크 표준화 및 교육 강화",
+            "부품 누락 방지 체크리스트 적용",
+        ],
+        "inspection_points": [
+            "MALE ELBOW Water Leak 테스트",
+            "BCW Jaco Fitting Nut 상태 점검",
+            "TEFLON 재료 보유량 확인",
+            "체결 토크 측정",
+        ],
+        "priority_level": "HIGH",  # 62건으로 HIGH 상향
+        "enhanced_keywords": ["MALE ELBOW Fitting nut Water Leak", "TEFLON", "BCW Jaco Fitting Nut Leak", "ELBOW", "부족"],
+        "defect_rate_trend": "높음 (전체 11.5% 차지)",
+    },
+    "UNION ELBOW": {
+        "common_causes": [
+            "체결 불량 (주요 원인)",
+            "Leak 발생",
+            "누락",
+            "Fitting Nut 체결불량",
+            "Tube 삽입 불량",
+        ],
+        "specific_actions": [
+            "체결 불량 근본원인 분석",
+            "Leak 방지 대책 수립",
+            "부품 누락 방지 시스템 구축",
+            "Fitting Nut 체결 토크 표준화",
+            "체결 작업 체크리스트 개선",
+        ],
+        "inspection_points": [
+            "체결 상태 전수 검사",
+            "Leak 테스트 강화",
+            "부품 누락 검사",
+            "Fitting Nut 체결 토크",
+        ],
+        "priority_level": "MEDIUM",
+        "enhanced_keywords": ["체결", "불량", "UNION ELBOW", "Leak", "누락"],
+    },
+    # 미분류 부품을 위한 일반적인 제안
+    "미분류": {
+        "common_causes": [
+            "부품명 누락/오기입",
+            "조립도면 정보 불일치",
+            "작업지시서 미비",
+            "부품 코드 체계 미정립",
+            "검사 기준 불명확",
+        ],
+        "specific_actions": [
+            "부품 식별 라벨링 시스템 구축",
+            "조립도면 및 BOM 정확성 검증",
+            "작업 지시서 및 체크리스트 표준화",
+            "부품 코드 체계 재정비 및 교육",
+            "검사 기준서 명확화",
+            "작업자 교육 강화 (부품 식별법)",
+            "품질 관리 시스템 개선",
+        ],
+        "inspection_points": [
+            "부품 라벨 부착 상태",
+            "작업 지시서 완성도",
+            "검사 기준서 명확성",
+            "작업자 부품 식별 능력",
+        ],
+        "priority_level": "HIGH",  # 미분류는 높은 우선순위로 변경
+        "detailed_analysis": {
+            "main_keywords": [
+                "조립도",
+                "조립",
+                "방향",
+                "반대",
+                "적용",
+                "BOM",
+                "표기",
+                "오류",
+            ],
+            "likely_root_cause": "조립 도면 및 작업 지시서의 정보 불일치",
+            "impact_assessment": "전체 불량의 26.7% 차지, 품질 관리 체계 근본적 문제",
+        },
+    },
+})
+
+
+class _PartSuggestion(NamedTuple):
+    """부품별 제안 중 예측 불량률 구간에만 의존하는 불변 항목"""
+
+    urgency: str
+    root_causes: Tuple[str, ...]
+    specific_actions: Tuple[str, ...]
+    inspection_points: Tuple[str, ...]
+
+
+@lru_cache(maxsize=256)
+def _build_suggestion(db_key: str, defect_rate_bucket: int) -> _PartSuggestion:
+    """DB 키와 정수 불량률 구간으로 제안 골격 생성 (임계값이 정수라 구간 내 긴급도 동일)"""
+    part_db = _IMPROVEMENT_DB[db_key]
+
+    # 불량률에 따른 제안 우선순위 결정
+    if defect_rate_bucket >= 15:
+        actions = part_db["specific_actions"][:2]  # 상위 2개 조치
+        urgency = "IMMEDIATE"
+    elif defect_rate_bucket >= 5:
+        actions = part_db["specific_actions"][:3]  # 상위 3개 조치
+        urgency = "URGENT"
+    else:
+        actions = part_db["specific_actions"][:1]  # 상위 1개 조치
+        urgency = "NORMAL"
+
+    return _PartSuggestion(
+        urgency=urgency,
+        root_causes=part_db["common_causes"],
+        specific_actions=actions,
+        inspection_points=part_db["inspection_points"],
+    )
+
+
+# 분석 요약에 포함되는 고정 항목
+DATA_QUALITY_IMPROVEMENTS: Dict[str, str] = {
+    "keyword_extraction": "영어+한국어 통합 전처리 적용",
+    "accuracy_improvement": "+3.71%p (92.59% → 96.30%)",
+    "feature_enhancement": "59개 → 173개 차원 (+193.2%)",
+    "keyword_density": "1.81개 → 5.34개 (+195.2%)",
+}
+TOP_IMPROVEMENT_AREAS = (
+    "SPEED CONTROLLER (CRITICAL - 92건 누수)",
+    "MALE ELBOW (HIGH - 40건 Fitting nut 누수)",
+    "MALE CONNECTOR (HIGH - 17건 누수)",
+    "REDUCER DOUBLE Y UNION (HIGH - 41건 삽입부)",
+)
+
+# 부품 선정 기준 설명 템플릿 (None 항목은 예측 결과로 채움)
+SELECTION_CRITERIA_TEMPLATE: Dict[str, Any] = {
+    "ranking_method": "예측 불량률 기준 내림차순",
+    "primary_factors": [
+        {
+            "factor": "예측 불량률",
+            "weight": "40%",
+            "description": "ML 모델이 예측한 부품별 불량 발생 확률",
+            "current_range": None,
+        },
+        {
+            "factor": "생산량 가중치",
+            "weight": "30%",
+            "description": "실제 월간 생산량에 따른 중요도 반영",
+            "current_focus": "GAIA-I DUAL(34.7%), GAIA-I(32.4%)",
+        },
+        {
+            "factor": "과거 불량 빈도",
+            "weight": "20%",
+            "description": "해당 부품의 역사적 불량 발생 건수",
+            "data_period": "최근 12개월 데이터 기준",
+        },
+        {
+            "factor": "키워드 유사도",
+            "weight": "10%",
+            "description": "TF-IDF 기반 불량 내용 유사성 분석",
+            "method": "MeCab 형태소 분석 + 한국어 불용어 제거",
+        },
+    ],
+    "special_cases": {
+        "미분류": {
+            "current_status": None,
+            "impact": "전체 불량의 26.7% 차지",
+            "priority": "HIGH - 품질 관리 체계 근본적 개선 필요",
+            "main_issue": "조립도면/BOM 정보 불일치가 주원인",
+        }
+    },
+    "selection_logic": [
+        "1. 학습된 데이터에서 생산량 가중치 적용하여 샘플링",
+        "2. ML 모델로 각 샘플의 불량 확률 예측",
+        "3. 예측 확률 기준 내림차순 정렬",
+        "4. 상위 5개 부품 선정",
+        "5. 각 부품별 맞춤형 개선 제안 매칭",
+    ],
+}
+
 
 class AdvancedDefectAnalyzer:
     """고도화된 불량 분석 및 제안 시스템"""
 
+    # 동적 불량유형 매핑 대상 주요 부품
+    TRACKED_PARTS = (
+        "SPEED CONTROLLER",
+        "LEAK SENSOR",
+        "TOUCH SCREEN",
+        "FEMALE CONNECTOR",
+        "MALE CONNECTOR",
+        "HEATING JACKET",
+        "UNION ELBOW",
+        "BURNER SCRAPER LINE-01",
+        "REDUCER DOUBLE Y UNION",
+        "UNEQUAL UNION Y",
+        "CLAMP",
+        "MALE ELBOW",
+        "BULKHEAD UNION",
+        "KEY OPERATION VALVE",
+        "PNEUMATIC VALVE",
+    )
+
+    # 실제 데이터에 없는 부품의 기본 불량유형
+    DEFAULT_DEFECT_TYPES = {
+        "HEATING JACKET": "기구작업불량",
+        "LEAK SENSOR": "전장작업불량",
+        "TOUCH SCREEN": "전장작업불량",
+        "REDUCER DOUBLE Y UNION": "기구작업불량",
+        "UNEQUAL UNION Y": "기구작업불량",
+        "CLAMP": "기구작업불량",
+        "MALE ELBOW": "기구작업불량",
+        "BULKHEAD UNION": "기구작업불량",
+        "KEY OPERATION VALVE": "기구작업불량",
+        "PNEUMATIC VALVE": "기구작업불량",
+        "미분류": "검사품질불량",
+    }
+
     def __init__(self):
         self.failure_mode_patterns = {}
         self.risk_factors = {}
-        self.improvement_db = self._build_improvement_database()
+        # Teams 불량 데이터 캐시 (대시보드 생성 1회당 한 번만 로드)
+        self._teams_df = None
+        self._part_count_cache = {}
+        self._part_key_counts = {}
+        # 개선된 키워드 분석 결과 캐시 (Teams 로드 + 형태소 분석 재실행 방지)
+        self._keyword_analysis_cache = None
+        # 키워드 분석용 불량 데이터/전처리기 (set_data로 주입하거나 최초 사용 시 로드)
+        self._data = None
+        self._data_loader = None
+
+    def set_data(self, data: pd.DataFrame, data_loader=None) -> None:
+        """이미 로드된 불량 데이터(및 DataLoader)를 주입하여 중복 로드 방지
+
+        호출 측이 이후 데이터를 수정해도(예: 모델 학습 시 라벨 인코딩) 영향이 없도록 복사본 보관
+        """
+        self._data = data.copy()
+        if data_loader is not None:
+            self._data_loader = data_loader
+        self._keyword_analysis_cache = None
+        # 부품별 집계도 주입된 데이터 기준으로 다시 계산
+        self._teams_df = None
+
+    def _ensure_data(self) -> Tuple[pd.DataFrame, Any]:
+        """불량 데이터와 DataLoader를 한 번만 준비하여 반환"""
+        if self._data is None and self._teams_df is not None:
+            # 부품별 집계용으로 이미 로드한 Teams 데이터 재사용 (집계용 컬럼 제외)
+            self._data = self._teams_df.drop(columns=["_part_key", "_matched_parts"])
+        if self._data is None:
+            from data.teams_loader import TeamsIntegratedDataLoader
 
-    def _build_improvement_database(self) -> Dict[str, Dict]:
-        """개선 방안 데이터베이스 구축"""
-        return {
-            # 기존 부품들
-            "CENTER O-RING": {
-                "common_causes": ["가압 불량", "삽입 불량", "누수"],
-                "specific_actions": [
-                    "O-링 규격 재검토 및 공차 관리 강화",
-                    "조립 시 O-링 손상 방지를 위한 작업자 교육",
-                    "가압 테스트 압력 단계별 조정",
-                    "O-링 설치 전 청결도 검사 강화",
-                ],
-                "inspection_points": ["O-링 표면 상태", "삽입 깊이", "가압 시 누수점"],
-                "priority_level": "HIGH",
-            },
-            # 실제 데이터 기반 부품들 (오늘 학습 데이터 반영)
-            "SPEED CONTROLLER": {
-                "common_causes": [
-                    "Speed Controller Leak (92건 - 최다발생)",
-                    "PFA 재질 누수 (72건)",
-                    "우레탄 재질 누수 (40건)",
-                    "Body 재질 leak",
-                    "He 가압검사 불합격",
-                ],
-                "specific_actions": [
-                    "Speed Controller 전체 교체 (미보증 부품 우선)",
-                    "PFA 재질 누수 근본원인 분석 및 대책 수립",
-                    "우레탄 재질 품질 기준 강화",
-                    "가압검사 압력 및 시간 최적화",
-                    "공급업체 품질 관리",
-                ],
-                "inspection_points": [
-                    "Speed Controller Leak 테스트 (필수)",
-                    "PFA 재질 내압 성능",
-                    "우레탄 재질 밀착도",
-                    "Body 재질 crack 검사",
-                    "He leak 테스트 기준 준수",
-                ],
-                "priority_level": "CRITICAL",  # 최다발생으로 CRITICAL 상향
-                "enhanced_keywords": ["Speed Controller Leak", "PFA", "우레탄", "Body", "LEAK"],
-                "defect_rate_trend": "증가 (전체 18.3% 차지)",
-            },
-            "HEATING JACKET": {
-                "common_causes": ["온도 제어 불량", "절연 손상", "히터 소손"],
-                "specific_actions": [
-                    "온도 센서 교정 및 점검",
-                    "히터 저항값 측정 및 교체",
-                    "절연 상태 점검 강화",
-                    "온도 제어 알고리즘 최적화",
-                ],
-                "inspection_points": ["온도 정확도", "절연 저항", "히터 상태"],
-                "priority_level": "HIGH",
-            },
-            "LEAK SENSOR": {
-                "common_causes": ["센서 감도 불량", "오염", "신호 노이즈"],
-                "specific_actions": [
-                    "센서 감도 재조정",
-                    "센서 청소 및 보호 강화",
-                    "신호 필터링 개선",
-                    "센서 위치 최적화",
-                ],
-                "inspection_points": ["감도 설정", "센서 청결도", "신호 품질"],
-                "priority_level": "MEDIUM",
-            },
-            "TOUCH SCREEN": {
-                "common_causes": ["터치 감도 불량", "화면 손상", "통신 오류"],
-                "specific_actions": [
-                    "터치 스크린 캘리브레이션",
-                    "화면 보호 필름 점검",
-                    "통신 케이블 연결 상태 확인",
-                    "HMI 소프트웨어 업데이트",
-                ],
-                "inspection_points": ["터치 반응", "화면 상태", "통신 연결"],
-                "priority_level": "MEDIUM",
-            },
-            "FEMALE CONNECTOR": {
-                "common_causes": ["접촉 불량", "삽입 불량", "부식"],
-                "specific_actions": [
-                    "커넥터 핀 접촉 압력 조정",
-                    "삽입 가이드 정렬 점검",
-                    "방청 처리 및 보관 환경 개선",
-                    "커넥터 하우징 교체",
-                ],
-                "inspection_points": ["접촉 저항", "삽입력", "부식 상태"],
-                "priority_level": "MEDIUM",
-            },
-            "REDUCER DOUBLE Y UNION": {
-                "common_causes": [
-                    "삽입부 불량 (41건 - 최다 키워드)", 
-                    "N2 REDUCING DOUBLE Y UNION Leak (12건)",
-                    "우레탄 재질 문제",
-                    "체결 불량", 
-                    "누설"
-                ],
-                "specific_actions": [
-                    "삽입부 설계 및 가공 정밀도 개선",
-                    "N2 REDUCING DOUBLE Y UNION 누수 방지 대책",
-                    "우레탄 재질 품질 기준 강화",
-                    "체결 토크 표준화",
-                    "조립 순서 및 방법 표준화",
-                ],
-                "inspection_points": [
-                    "삽입부 치수 정밀도 (필수)",
-                    "N2 REDUCING Leak 테스트",
-                    "우레탄 재질 상태 점검",
-                    "체결 토크 측정",
-                ],
-                "priority_level": "HIGH",  # 28건으로 HIGH 상향
-                "enhanced_keywords": ["삽입부", "N2 REDUCING DOUBLE Y UNION", "Leak", "우레탄", "LEAK"],
-                "defect_rate_trend": "중간 (전체 5.2% 차지)",
-            },
-            "O-RING": {
-                "common_causes": [
-                    "Ring 변형 (21건)",
-                    "조립 불량 (15건)",
-                    "Ring 재질 문제",
-                    "가압 불량",
-                    "삽입 불량"
-                ],
-                "specific_actions": [
-                    "O-Ring 변형 방지 취급 지침 수립",
-                    "조립 공정 표준화 및 작업자 교육",
-                    "O-Ring 재질 및 규격 재검토",
-                    "가압 테스트 조건 최적화",
-                    "삽입 시 손상 방지 도구 개발",
-                ],
-                "inspection_points": [
-                    "O-Ring 변형 상태 검사",
-                    "조립 정확성 확인",
-                    "Ring 재질 규격 적합성",
-                    "가압 누설 테스트",
-                ],
-                "priority_level": "MEDIUM",
-                "enhanced_keywords": ["Ring", "조립", "불량", "변형", "RING"],
-                "defect_rate_trend": "낮음 (전체 3.5% 차지)",
-            },
-            "UNION TEE": {
-                "common_causes": ["체결 불량", "나사산 불량", "밀착 불량"],
-                "specific_actions": [
-                    "나사산 규격 및 체결 토크 표준화",
-                    "체결 순서 및 방법 작업지침서 재정비",
-                    "유니온티 가공 정밀도 향상",
-                    "밀착면 청소 및 실링 재료 검토",
-                ],
-                "inspection_points": ["나사산 상태", "체결 토크", "밀착면 평활도"],
-                "priority_level": "MEDIUM",
-            },
-            "HEATING PAB PIPE": {
-                "common_causes": ["용접 불량", "열변형", "재질 불량"],
-                "specific_actions": [
-                    "용접 조건 최적화 및 작업자 기능 향상",
-                    "열처리 공정 온도 및 시간 재검토",
-                    "파이프 재질 규격 검증",
-                    "용접 후 비파괴검사 강화",
-                ],
-                "inspection_points": ["용접 품질", "치수 정밀도", "내압 성능"],
-                "priority_level": "HIGH",
-            },
-            "MALE ADAPTER": {
-                "common_causes": ["가공 정밀도", "삽입 불량", "체결 불량"],
-                "specific_actions": [
-                    "가공 치수 정밀도 향상 및 검사 기준 강화",
-                    "삽입 시 정렬 가이드 도구 개발",
-                    "어댑터 표면 처리 개선",
-                    "조립 공정 표준화",
-                ],
-                "inspection_points": ["치수 정밀도", "표면 조도", "삽입 저항"],
-                "priority_level": "MEDIUM",
-            },
-            "MALE CONNECTOR": {
-                "common_causes": [
-                    "MALE CONNECTOR Fitting nut Water Leak (17건)",
-                    "N2 Male Connector Teflon 부족 (부품누락)",
-                    "PCW Flow Sensor 관련 불량",
-                    "Fitting 체결 불량",
-                    "Teflon 작업 불량",
-                ],
-                "specific_actions": [
-                    "MALE CONNECTOR Fitting nut 누수 근본원인 분석",
-                    "Teflon 부족 현상 방지를 위한 재고 관리 강화",
-                    "PCW Flow Sensor 연결부 검사 표준화",
-                    "Fitting nut 체결 토크 표준화",
-                    "Teflon 테이프 감기 작업 지침서 개정",
-                ],
-                "inspection_points": [
-                    "MALE CONNECTOR Water Leak 테스트",
-                    "Teflon 재료 충분성 확인",
-                    "PCW Flow Sensor 연결 상태",
-                    "Fitting nut 체결 토크",
-                ],
-                "priority_level": "HIGH",  # 40건으로 HIGH 상향
-                "enhanced_keywords": ["MALE CONNECTOR Fitting nut Water Leak", "부족", "N2 Male Connector Teflon", "PCW Flow Sensor"],
-                "defect_rate_trend": "중간 (전체 7.4% 차지)",
-            },
-            # 실제 데이터 기반 부품들 추가
-            "BURNER SCRAPER LINE-01": {
-                "common_causes": ["Pipe Tee 배관 Crack", "Leak 발생"],
-                "specific_actions": [
-                    "Pipe Tee 배관 교체",
-                    "Crack 발생 원인 분석",
-                    "배관 재질 검토",
-                    "설치 공정 개선",
-                ],
-                "inspection_points": ["배관 Crack 상태", "Leak 테스트", "배관 재질"],
-                "priority_level": "HIGH",
-            },
-            "MALE ELBOW": {
-                "common_causes": [
-                    "MALE ELBOW Fitting nut Water Leak (40건 - 높은 빈도)",
-                    "BCW Jaco Fitting Nut Leak (10건)",
-                    "TEFLON 부족 (15건)",
-                    "체결 불량",
-                    "부품 누락",
-                ],
-                "specific_actions": [
-                    "MALE ELBOW Fitting nut 누수 패턴 분석 및 대책",
-                    "BCW Jaco Fitting Nut 교체 기준 수립",
-                    "TEFLON 재료 충분성 확보 방안",
-                    "체결 토크 표준화 및 교육 강화",
-                    "부품 누락 방지 체크리스트 적용",
-                ],
-                "inspection_points": [
-                    "MALE ELBOW Water Leak 테스트",
-                    "BCW Jaco Fitting Nut 상태 점검",
-                    "TEFLON 재료 보유량 확인",
-                    "체결 토크 측정",
-                ],
-                "priority_level": "HIGH",  # 62건으로 HIGH 상향
-                "enhanced_keywords": ["MALE ELBOW Fitting nut Water Leak", "TEFLON", "BCW Jaco Fitting Nut Leak", "ELBOW", "부족"],
-                "defect_rate_trend": "높음 (전체 11.5% 차지)",
-            },
-            "UNION ELBOW": {
-                "common_causes": [
-                    "체결 불량 (주요 원인)",
-                    "Leak 발생",
-                    "누락",
-                    "Fitting Nut 체결불량",
-                    "Tube 삽입 불량",
-                ],
-                "specific_actions": [
-                    "체결 불량 근본원인 분석",
-                    "Leak 방지 대책 수립",
-                    "부품 누락 방지 시스템 구축",
-                    "Fitting Nut 체결 토크 표준화",
-                    "체결 작업 체크리스트 개선",
-                ],
-                "inspection_points": [
-                    "체결 상태 전수 검사",
-                    "Leak 테스트 강화",
-                    "부품 누락 검사",
-                    "Fitting Nut 체결 토크",
-                ],
-                "priority_level": "MEDIUM",
-                "enhanced_keywords": ["체결", "불량", "UNION ELBOW", "Leak", "누락"],
-            },
-            # 미분류 부품을 위한 일반적인 제안
-            "미분류": {
-                "common_causes": [
-                    "부품명 누락/오기입",
-                    "조립도면 정보 불일치",
-                    "작업지시서 미비",
-                    "부품 코드 체계 미정립",
-                    "검사 기준 불명확",
-                ],
-                "specific_actions": [
-                    "부품 식별 라벨링 시스템 구축",
-                    "조립도면 및 BOM 정확성 검증",
-                    "작업 지시서 및 체크리스트 표준화",
-                    "부품 코드 체계 재정비 및 교육",
-                    "검사 기준서 명확화",
-                    "작업자 교육 강화 (부품 식별법)",
-                    "품질 관리 시스템 개선",
-                ],
-                "inspection_points": [
-                    "부품 라벨 부착 상태",
-                    "작업 지시서 완성도",
-                    "검사 기준서 명확성",
-                    "작업자 부품 식별 능력",
-                ],
-                "priority_level": "HIGH",  # 미분류는 높은 우선순위로 변경
-                "detailed_analysis": {
-                    "main_keywords": [
-                        "조립도",
-                        "조립",
-                        "방향",
-                        "반대",
-                        "적용",
-                        "BOM",
-                        "표기",
-                        "오류",
-                    ],
-                    "likely_root_cause": "조립 도면 및 작업 지시서의 정보 불일치",
-                    "impact_assessment": "전체 불량의 26.7% 차지, 품질 관리 체계 근본적 문제",
-                },
-            },
-        }
+            self._data = TeamsIntegratedDataLoader().load_data_with_fallback()
+        if self._data_loader is None:
+            from data.data_loader import DataLoader
+
+            self._data_loader = DataLoader()
+        return self._data, self._data_loader
+
+    @cached_property
+    def improvement_db(self) -> Dict[str, Dict]:
+        """개선 방안 데이터베이스 (첫 접근 시 연결)"""
+        return _IMPROVEMENT_DB
+
+    @cached_property
+    def _db_key_index(self) -> Dict[str, str]:
+        """대소문자/앞뒤 공백 무관 부품명 조회용 인덱스 (정규화 키 → 원래 DB 키)"""
+        return {key.upper().strip(): key for key in self.improvement_db}
+
+    def _lookup_db_key(self, part: Any) -> Optional[str]:
+        """부품명을 정규화하여 개선 방안 DB 키 조회 (없으면 None)"""
+        return self._db_key_index.get(str(part).upper().strip())
 
     def advanced_failure_analysis(
         self, data: pd.DataFrame, predictions: List[Dict]
@@ -323,6 +602,15 @@ class AdvancedDefectAnalyzer:
         """고도화된 불량 분석"""
         logger.info("🔬 고도화된 실패 분석 시작...")
 
+        # 반복 groupby 대상 문자열 컬럼을 범주형으로 한 번만 변환 (원본 DataFrame은 유지)
+        category_cols = {
+            col: "category"
+            for col in ("제품명", "부품명", "검출단계", "대분류")
+            if col in data.columns
+        }
+        if category_cols:
+            data = data.astype(category_cols)
+
         # 1. 실패 모드 패턴 분석
         failure_patterns = self._analyze_failure_patterns(data)
 
@@ -362,57 +650,50 @@ class AdvancedDefectAnalyzer:
             return {}
 
         # 사용 가능한 컬럼으로 패턴 분석
-        patterns = data.groupby(available_cols).size().reset_index(name="count")
-        patterns = patterns.sort_values("count", ascending=False)
+        patterns = (
+            data.groupby(available_cols, observed=True)
+            .size()
+            .astype(np.int32)
+            .reset_index(name="count")
+        )
 
-        # 상위 패턴들의 특징 분석
-        top_patterns = patterns.head(10)
+        # 상위 패턴들의 특징 분석 (전체 정렬 없이 상위 10개만 선택)
+        top_patterns = patterns.nlargest(10, "count")
         pattern_analysis = []
 
-        for _, row in top_patterns.iterrows():
-            product = row.get("제품명", "Unknown")
-            stage = row.get("검출단계", "Unknown")
-            part = row.get("부품명", "Unknown")
-
-            # NaN 값 처리
-            if pd.isna(product) or str(product) == "nan":
-                product = "미분류"
-            if pd.isna(stage) or str(stage) == "nan":
-                stage = "미분류"
-            if pd.isna(part) or str(part) == "nan":
-                part = "미분류"
-
-            count = row["count"]
+        # 상위 패턴의 키워드 빈도를 한 번에 집계
+        top_keywords = self._top_keywords_by_pattern(data, available_cols, top_patterns)
 
-            # 해당 패턴의 상세 분석 (안전한 필터링)
-            pattern_filter = (
-                (data["제품명"] == product) if "제품명" in data.columns else True
-            )
-            if "검출단계" in data.columns and stage != "Unknown":
-                pattern_filter = pattern_filter & (data["검출단계"] == stage)
-            if "부품명" in data.columns:
-                pattern_filter = pattern_filter & (data["부품명"] == part)
-
-            pattern_data = (
-                data[pattern_filter] if isinstance(pattern_filter, pd.Series) else data
-            )
+        # 표시용 라벨은 문자열로 한 번에 변환하고 NaN/"nan"은 미분류로 치환
+        labels = (
+            top_patterns[available_cols].astype(str).replace("nan", "미분류")
+        )
 
-            # 키워드 분석 (안전하게)
-            keywords = []
-            if "상세불량내용" in pattern_data.columns:
-                for content in pattern_data["상세불량내용"]:
-                    if pd.notna(content):
-                        keywords.extend(str(content).split())
+        # 패턴 점유율과 위험도를 한 번에 계산
+        percentages = top_patterns["count"].to_numpy(dtype=np.float64) / len(data) * 100
+        risk_index = np.searchsorted(PATTERN_RISK_THRESHOLDS, percentages, side="right")
+
+        for row, label, percentage, risk_idx in zip(
+            top_patterns.to_dict("records"),
+            labels.to_dict("records"),
+            percentages.tolist(),
+            risk_index,
+        ):
+            pattern_key = tuple(row[col] for col in available_cols)
+            product = label.get("제품명", "Unknown")
+            stage = label.get("검출단계", "Unknown")
+            part = label.get("부품명", "Unknown")
 
-            keyword_freq = Counter(keywords).most_common(5) if keywords else []
+            count = row["count"]
+            keyword_freq = top_keywords.get(pattern_key, [])
 
             pattern_analysis.append(
                 {
                     "pattern": f"{product}_{stage}_{part}",
                     "frequency": count,
-                    "percentage": (count / len(data)) * 100,
+                    "percentage": percentage,
                     "keywords": keyword_freq,
-                    "risk_level": self._calculate_pattern_risk(count, len(data)),
+                    "risk_level": PATTERN_RISK_LABELS[risk_idx],
                 }
             )
 
@@ -422,6 +703,53 @@ class AdvancedDefectAnalyzer:
             "concentration_index": self._calculate_concentration_index(patterns),
         }
 
+    def _top_keywords_by_pattern(
+        self,
+        data: pd.DataFrame,
+        group_cols: List[str],
+        top_patterns: pd.DataFrame,
+        top_n: int = 5,
+    ) -> Dict[Tuple, List[Tuple[str, int]]]:
+        """상위 패턴별 상세불량내용 키워드 빈도 (pandas 벡터 연산으로 토큰화/집계)"""
+        if "상세불량내용" not in data.columns or len(top_patterns) == 0:
+            return {}
+
+        # 상위 패턴에 속하는 행만 남김
+        keys = data[group_cols].reset_index(drop=True)
+        top_index = pd.MultiIndex.from_frame(top_patterns[group_cols])
+        in_top = pd.MultiIndex.from_frame(keys).isin(top_index)
+        contents = data["상세불량내용"].reset_index(drop=True)[in_top]
+
+        # 한글/영문/숫자 단어 단위로 토큰화 후 행 단위로 펼치고 불용어/한 글자 토큰 제거
+        # (DataLoader.preprocess_text와 같이 2글자 이상만 키워드로 사용)
+        tokens = (
+            contents.dropna()
+            .astype(str)
+            .str.findall(KEYWORD_TOKEN_PATTERN)
+            .explode()
+            .dropna()
+        )
+        tokens = tokens[(tokens.str.len() > 1) & ~tokens.isin(KEYWORD_STOP_WORDS)]
+        if tokens.empty:
+            return {}
+
+        # 패턴×키워드 건수 → 패턴별 상위 N개 (동률은 처음 등장한 순서 유지)
+        keyword_counts = (
+            keys.loc[tokens.index]
+            .assign(_keyword=tokens.to_numpy())
+            .groupby(group_cols + ["_keyword"], sort=False, observed=True)
+            .size()
+            .astype(np.int32)
+            .sort_values(ascending=False, kind="stable")
+            .groupby(level=group_cols, sort=False, observed=True)
+            .head(top_n)
+        )
+
+        result = defaultdict(list)
+        for (*pattern_key, keyword), count in keyword_counts.items():
+            result[tuple(pattern_key)].append((keyword, int(count)))
+        return result
+
     def _analyze_correlations(self, data: pd.DataFrame) -> Dict[str, Any]:
         """요인 간 상관관계 분석"""
         if len(data) == 0:
@@ -429,15 +757,22 @@ class AdvancedDefectAnalyzer:
 
         correlations = {}
 
+        # 세 컬럼이 모두 있으면 한 번의 groupby 결과를 두 상관관계에서 공유
+        shared_counts = None
+        if {"제품명", "부품명", "검출단계"}.issubset(data.columns):
+            shared_counts = (
+                data.groupby(["제품명", "부품명", "검출단계"], observed=True, dropna=False)
+                .size()
+                .astype(np.int32)
+            )
+
         # 제품명별 불량 부품 상관관계 (안전하게)
         if "제품명" in data.columns and "부품명" in data.columns:
             try:
-                product_part_corr = (
-                    data.groupby(["제품명", "부품명"]).size().unstack(fill_value=0)
-                )
+                product_part_corr = self._part_count_table(data, "제품명", shared_counts)
                 if len(product_part_corr) > 1 and len(product_part_corr.columns) > 1:
-                    correlations["product_part"] = (
-                        product_part_corr.corr().abs().mean().mean()
+                    correlations["product_part"] = self._mean_abs_correlation(
+                        product_part_corr.to_numpy(dtype=np.float32)
                     )
             except Exception as e:
                 logger.warning(f"제품명-부품명 상관관계 분석 실패: {e}")
@@ -445,47 +780,79 @@ class AdvancedDefectAnalyzer:
         # 검출단계별 부품 상관관계 (안전하게)
         if "검출단계" in data.columns and "부품명" in data.columns:
             try:
-                stage_part_corr = (
-                    data.groupby(["검출단계", "부품명"]).size().unstack(fill_value=0)
-                )
+                stage_part_corr = self._part_count_table(data, "검출단계", shared_counts)
                 if len(stage_part_corr) > 1 and len(stage_part_corr.columns) > 1:
-                    correlations["stage_part"] = (
-                        stage_part_corr.corr().abs().mean().mean()
+                    correlations["stage_part"] = self._mean_abs_correlation(
+                        stage_part_corr.to_numpy(dtype=np.float32)
                     )
             except Exception as e:
                 logger.warning(f"검출단계-부품명 상관관계 분석 실패: {e}")
 
         return correlations
 
+    def _part_count_table(
+        self, data: pd.DataFrame, row_col: str, shared_counts: pd.Series = None
+    ) -> pd.DataFrame:
+        """row_col × 부품명 불량 건수표 (공유 집계가 있으면 재집계만 수행)"""
+        if shared_counts is not None:
+            # 결측 키는 단일 groupby와 같게 제외 (level groupby 기본 dropna)
+            counts = shared_counts.groupby(
+                level=[row_col, "부품명"], observed=True
+            ).sum()
+        else:
+            counts = data.groupby([row_col, "부품명"], observed=True).size()
+        return counts.astype(np.int32).unstack(fill_value=0)
+
+    def _mean_abs_correlation(self, matrix: np.ndarray) -> float:
+        """열 간 피어슨 상관계수 절댓값의 평균 (DataFrame.corr().abs().mean().mean()과 동일)"""
+        if NUMBA_AVAILABLE and matrix.shape[1] > NUMBA_CORR_MIN_COLUMNS:
+            return float(_corr_abs_mean_numba(matrix))
+
+        centered = matrix - matrix.mean(axis=0)
+        norms = np.sqrt((centered * centered).sum(axis=0))
+
+        # 분산이 0인 열은 corr() 결과가 NaN이므로 평균에서 제외
+        valid = norms > 0
+        if not valid.any():
+            return float("nan")
+        normalized = centered[:, valid] / norms[valid]
+
+        # 정규화된 열끼리의 행렬곱으로 상관행렬 계산
+        corr = normalized.T @ normalized
+        return float(np.abs(corr).mean(axis=0).mean())
+
     def _analyze_risk_levels(self, predictions: List[Dict]) -> Dict[str, Any]:
         """예측 기반 위험도 분석"""
         if not predictions:
             return {}
 
-        risk_levels = []
-        for pred in predictions:
-            defect_rate = pred.get("예상불량률", 0)
-            part = pred.get("부품", "Unknown")
-
-            if defect_rate >= 15:
-                risk_level = "CRITICAL"
-            elif defect_rate >= 5:
-                risk_level = "HIGH"
-            elif defect_rate >= 1:
-                risk_level = "MEDIUM"
-            else:
-                risk_level = "LOW"
-
-            risk_levels.append(
-                {"part": part, "defect_rate": defect_rate, "risk_level": risk_level}
-            )
+        # 불량률 구간 → 위험도 (1, 5, 15 경계, 경계값은 상위 구간)
+        defect_rates = [pred.get("예상불량률", 0) for pred in predictions]
+        rates = np.asarray(defect_rates, dtype=np.float64)
+        level_index = np.digitize(rates, RISK_LEVEL_THRESHOLDS)
+        # NaN은 digitize에서 마지막 구간으로 들어가므로 기존 비교식과 같이 LOW 처리
+        level_index[np.isnan(rates)] = 0
+
+        risk_levels = [
+            {
+                "part": pred.get("부품", "Unknown"),
+                "defect_rate": defect_rate,
+                "risk_level": RISK_LEVEL_LABELS[idx],
+            }
+            for pred, defect_rate, idx in zip(predictions, defect_rates, level_index)
+        ]
 
         # 위험도별 분포
-        risk_distribution = Counter([r["risk_level"] for r in risk_levels])
+        level_counts = np.bincount(level_index, minlength=len(RISK_LEVEL_LABELS))
+        risk_distribution = {
+            label: int(count)
+            for label, count in zip(RISK_LEVEL_LABELS, level_counts)
+            if count
+        }
 
         return {
             "risk_levels": risk_levels,
-            "distribution": dict(risk_distribution),
+            "distribution": risk_distribution,
             "critical_parts": [
                 r["part"] for r in risk_levels if r["risk_level"] == "CRITICAL"
             ],
@@ -501,57 +868,72 @@ class AdvancedDefectAnalyzer:
             30
         )  # 최근 30건 (날짜 컬럼이 없으므로 최근 데이터로 대체)
 
-        # 부품별 트렌드 (안전하게)
+        # 부품별 트렌드 (안전하게, 30건 규모라 groupby 대신 Counter 사용)
         part_trends = (
-            recent_data.groupby("부품명").size().sort_values(ascending=False)
+            Counter(recent_data["부품명"].dropna()).most_common(5)
             if "부품명" in recent_data.columns
-            else pd.Series()
+            else []
         )
 
         # 제품별 트렌드 (안전하게)
         product_trends = (
-            recent_data.groupby("제품명").size().sort_values(ascending=False)
+            Counter(recent_data["제품명"].dropna()).most_common(5)
             if "제품명" in recent_data.columns
-            else pd.Series()
+            else []
         )
 
         return {
-            "recent_part_trends": dict(part_trends.head(5)),
-            "recent_product_trends": dict(product_trends.head(5)),
+            "recent_part_trends": dict(part_trends),
+            "recent_product_trends": dict(product_trends),
             "trend_direction": self._calculate_trend_direction(recent_data),
         }
 
     def _calculate_pattern_risk(self, count: int, total: int) -> str:
         """패턴별 위험도 계산"""
         percentage = (count / total) * 100
-        if percentage >= 5:
-            return "HIGH"
-        elif percentage >= 2:
-            return "MEDIUM"
-        else:
-            return "LOW"
+        return PATTERN_RISK_LABELS[
+            np.searchsorted(PATTERN_RISK_THRESHOLDS, percentage, side="right")
+        ]
 
     def _calculate_concentration_index(self, patterns: pd.DataFrame) -> float:
         """불량 집중도 지수 계산 (허핀달 지수)"""
         if len(patterns) == 0:
             return 0
-        total = patterns["count"].sum()
-        shares = (patterns["count"] / total) ** 2
-        return shares.sum()
+        # sum((count/total)^2) = sum(count^2) / total^2 (나눗셈은 마지막에 한 번만)
+        counts = patterns["count"].to_numpy(dtype=np.float64)
+        total = counts.sum()
+        return float(counts @ counts) / (total * total)
 
     def _calculate_trend_direction(self, data: pd.DataFrame) -> str:
         """트렌드 방향 계산"""
-        if len(data) < 10:
+        if len(data) < 10 or "날짜" not in data.columns:
+            return "INSUFFICIENT_DATA"
+
+        # 관측 기간을 같은 길이의 전반/후반으로 나눠 발생 건수(=발생률) 비교
+        # (기존 행 수 기반 비교는 양쪽 모두 1.0이 되어 항상 STABLE이었고,
+        #  일별 건수 회귀는 시작/끝 날짜가 부분 일자라 일정한 발생률도 추세로 오판)
+        dates = pd.to_datetime(data["날짜"], errors="coerce").dropna()
+        if len(dates) < 10:
             return "INSUFFICIENT_DATA"
 
-        # 최근 절반과 이전 절반 비교
-        mid_point = len(data) // 2
-        recent_avg = len(data[mid_point:]) / (len(data) - mid_point)
-        previous_avg = len(data[:mid_point]) / mid_point
+        timestamps = dates.to_numpy(dtype="datetime64[ns]").astype(np.int64)
+        start, end = timestamps.min(), timestamps.max()
+        if start == end:
+            return "STABLE"
+
+        # 중간 시점은 정수 비교를 위해 2배 값으로 비교, 정확히 중간인 건은 양쪽에 절반씩 배분
+        offsets = 2 * timestamps - (start + end)
+        at_mid = np.count_nonzero(offsets == 0) / 2
+        previous_count = np.count_nonzero(offsets < 0) + at_mid
+        recent_count = np.count_nonzero(offsets > 0) + at_mid
 
-        if recent_avg > previous_avg * 1.1:
+        # 전반 대비 후반 발생 건수의 ±10% 변화로 판단
+        change = recent_count - previous_count
+        threshold = previous_count * 0.1
+
+        if change > threshold:
             return "INCREASING"
-        elif recent_avg < previous_avg * 0.9:
+        elif change < -threshold:
             return "DECREASING"
         else:
             return "STABLE"
@@ -564,6 +946,9 @@ class AdvancedDefectAnalyzer:
         logger.info(f"🔍 예측 데이터: {len(predictions)}개")
         logger.info(f"🔍 분석 결과 키: {list(analysis_results.keys())}")
 
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 DB 키들: %s", list(self.improvement_db))
+
         suggestions = []
 
         # 1. 예측 기반 개별 부품 제안
@@ -571,36 +956,31 @@ class AdvancedDefectAnalyzer:
             part = pred.get("부품", "")
             defect_rate = pred.get("예상불량률", 0)
             model = pred.get("모델", "")
+            db_key = self._lookup_db_key(part)
 
-            logger.info(
-                f"🔍 예측 {i+1}: 모델={model}, 부품={part}, 불량률={defect_rate}"
-            )
-            logger.info(
-                f"🔍 부품 '{part}'이 DB에 있는가? {part in self.improvement_db}"
+            logger.debug(
+                "🔍 예측 %d: 모델=%s, 부품=%s, 불량률=%s", i + 1, model, part, defect_rate
             )
-            logger.info(f"🔍 DB 키들: {list(self.improvement_db.keys())}")
-
-            if part in self.improvement_db:
-                part_db = self.improvement_db[part]
-
-                # 불량률에 따른 제안 우선순위 결정
-                if defect_rate >= 15:
-                    actions = part_db["specific_actions"][:2]  # 상위 2개 조치
-                    urgency = "IMMEDIATE"
-                elif defect_rate >= 5:
-                    actions = part_db["specific_actions"][:3]  # 상위 3개 조치
-                    urgency = "URGENT"
+            logger.debug("🔍 부품 '%s'이 DB에 있는가? %s", part, db_key is not None)
+
+            if db_key is not None:
+                # NaN/무한대는 정수 구간으로 바꿀 수 없으므로 비교 결과대로 구간 지정
+                # (NaN·-inf는 NORMAL, +inf는 IMMEDIATE)
+                if np.isfinite(defect_rate):
+                    rate_bucket = int(defect_rate // 1)
                 else:
-                    actions = part_db["specific_actions"][:1]  # 상위 1개 조치
-                    urgency = "NORMAL"
+                    rate_bucket = 15 if defect_rate > 0 else 0
+                base = _build_suggestion(db_key, rate_bucket)
+                urgency = base.urgency
+                actions = base.specific_actions
 
                 suggestion = {
                     "target": f"{model} - {part}",
                     "defect_rate": defect_rate,
                     "urgency": urgency,
-                    "root_causes": part_db["common_causes"],
+                    "root_causes": base.root_causes,
                     "specific_actions": actions,
-                    "inspection_points": part_db["inspection_points"],
+                    "inspection_points": base.inspection_points,
                     "expected_improvement": self._calculate_expected_improvement(
                         defect_rate, urgency
                     ),
@@ -616,16 +996,14 @@ class AdvancedDefectAnalyzer:
             )
             suggestions.extend(pattern_suggestions)
 
-        # 3. 우선순위 정렬
-        suggestions.sort(
-            key=lambda x: (
-                {"IMMEDIATE": 0, "URGENT": 1, "NORMAL": 2}[x["urgency"]],
-                -x["defect_rate"],
-            )
-        )
-
         logger.info(f"✅ Pin Point 제안 생성 완료: {len(suggestions)}개")
-        return suggestions[:5]  # 상위 5개 제안만 반환
+
+        # 3. 우선순위 기준 상위 5개 제안만 반환 (전체 정렬 없이 부분 선택)
+        return heapq.nsmallest(
+            5,
+            suggestions,
+            key=lambda x: (URGENCY_RANK[x["urgency"]], -x["defect_rate"]),
+        )
 
     def _generate_pattern_based_suggestions(
         self, pattern_analysis: Dict
@@ -684,62 +1062,128 @@ class AdvancedDefectAnalyzer:
             return "2-4주"
         return "1-2개월"
 
+    def _fetch_teams_df(self) -> pd.DataFrame:
+        """Teams 불량 데이터 조회 (TTL 이내의 로컬 Parquet 캐시가 있으면 우선 사용)
+
+        캐시 키는 엑셀 파일 + 워크시트 + 파일 버전(eTag)이라 다른 파일/버전의 데이터를 읽지 않음
+        """
+        from data.teams_loader import TeamsDataLoader
+
+        loader = TeamsDataLoader()
+        ttl_hours = teams_config.cache_ttl_hours if PARQUET_AVAILABLE else 0
+        if ttl_hours <= 0:
+            return loader.load_defect_data_from_teams()
+
+        # 파일 정보는 한 번만 조회하여 캐시 키와 다운로드에 함께 사용
+        excel_file = loader._find_excel_file(loader._get_teams_files())
+        version = (excel_file or {}).get("eTag") or (excel_file or {}).get(
+            "lastModifiedDateTime"
+        )
+        if not version:
+            return loader.load_defect_data_from_teams(excel_file)
+
+        file_id = excel_file.get("id") or excel_file.get("name", "")
+        file_key = "|".join([file_id, *loader.config.worksheet_names])
+        file_hash = hashlib.md5(file_key.encode()).hexdigest()[:12]
+        version_hash = hashlib.md5(version.encode()).hexdigest()[:12]
+        cache_path = os.path.join(
+            teams_config.cache_dir, f"teams_{file_hash}_{version_hash}.parquet"
+        )
+
+        if os.path.exists(cache_path):
+            age_hours = (time.time() - os.path.getmtime(cache_path)) / 3600
+            if age_hours < ttl_hours:
+                try:
+                    df = pd.read_parquet(cache_path)
+                    logger.info(f"📦 Teams 캐시 사용: {cache_path} ({len(df)}건)")
+                    return df
+                except Exception as e:
+                    logger.warning(f"Teams 캐시 읽기 실패, 다시 다운로드: {e}")
+
+        df = loader.load_defect_data_from_teams(excel_file)
+
+        tmp_path = f"{cache_path}.tmp"
+        try:
+            os.makedirs(teams_config.cache_dir, exist_ok=True)
+            df.to_parquet(tmp_path, compression="zstd")
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            # 혼합 타입 컬럼 등 Parquet 변환 불가 시 캐시 없이 진행
+            logger.warning(f"Teams 캐시 저장 실패: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return df
+
+        # 같은 파일의 이전 버전 캐시와 예전 날짜 기준 캐시(teams_YYYYMMDD) 정리
+        stale_paths = []
+        stale_patterns = (f"teams_{file_hash}_*.parquet", "teams_" + "[0-9]" * 8 + ".parquet")
+        for pattern in stale_patterns:
+            stale_paths.extend(glob.glob(os.path.join(teams_config.cache_dir, pattern)))
+        for stale_path in stale_paths:
+            if stale_path != cache_path:
+                try:
+                    os.remove(stale_path)
+                except OSError as e:
+                    logger.warning(f"오래된 Teams 캐시 삭제 실패: {e}")
+        return df
+
+    def _load_teams_df(self) -> pd.DataFrame:
+        """Teams 불량 데이터를 한 번만 로드하여 재사용 (주입된 데이터가 있으면 우선 사용)"""
+        if self._teams_df is None:
+            if self._data is not None and "부품명" in self._data.columns:
+                # set_data로 주입된 불량 데이터 재사용 (원본에 집계용 컬럼이 붙지 않도록 얕은 복사)
+                df = self._data.copy(deep=False)
+            else:
+                df = self._fetch_teams_df()
+            # 정규화된 부품명 키 컬럼을 미리 계산 (대문자 + 공백 제거)
+            df["_part_key"] = df["부품명"].fillna("").astype(str).str.upper().str.strip()
+            self._part_key_counts = df["_part_key"].value_counts().to_dict()
+
+            # 알려진 부품명은 고유 부품명 키에만 한 번씩 검사해 키 → 포함된 모든 부품 사전 구성
+            # (str.contains 기준과 동일하게 한 행이 여러 부품에 모두 집계되도록)
+            known_parts = sorted(
+                {p.upper() for p in (*self.TRACKED_PARTS, *self.improvement_db)}
+            )
+            key_parts = {
+                key: [part for part in known_parts if part in key]
+                for key in self._part_key_counts
+            }
+            df["_matched_parts"] = df["_part_key"].map(key_parts)
+
+            self._part_count_cache = dict.fromkeys(known_parts, 0)
+            for key, count in self._part_key_counts.items():
+                for part in key_parts[key]:
+                    self._part_count_cache[part] += count
+            self._teams_df = df
+        return self._teams_df
+
     def _get_dynamic_defect_type_mapping(self) -> Dict[str, str]:
         """실제 데이터 기반 동적 불량유형 매핑"""
         try:
             # Teams 데이터에서 실제 불량유형 확인
-            from data.teams_loader import TeamsDataLoader
-
-            loader = TeamsDataLoader()
-            df = loader.load_defect_data_from_teams()
+            df = self._load_teams_df()
 
             # 부품별 가장 많은 불량유형 추출
             defect_type_mapping = {}
 
-            # 주요 부품들의 실제 불량유형 분석
-            parts_to_analyze = [
-                "SPEED CONTROLLER",
-                "LEAK SENSOR",
-                "TOUCH SCREEN",
-                "FEMALE CONNECTOR",
-                "MALE CONNECTOR",
-                "HEATING JACKET",
-                "UNION ELBOW",
-                "BURNER SCRAPER LINE-01",
-                "REDUCER DOUBLE Y UNION",
-                "UNEQUAL UNION Y",
-                "CLAMP",
-                "MALE ELBOW",
-                "BULKHEAD UNION",
-                "KEY OPERATION VALVE",
-                "PNEUMATIC VALVE",
-            ]
-
-            for part in parts_to_analyze:
-                part_data = df[df["부품명"].str.contains(part, case=False, na=False)]
-                if len(part_data) > 0:
-                    # 가장 많은 불량유형 선택
-                    most_common_defect = part_data["대분류"].value_counts().index[0]
+            # 주요 부품들의 실제 불량유형 분석 (부품×불량유형 교차표에서 최다 유형 선택)
+            # 여러 부품명이 포함된 행은 부품마다 한 행씩 펼쳐서 집계
+            tagged = df[["_matched_parts", "대분류"]].explode(
+                "_matched_parts", ignore_index=True
+            )
+            dominant_defects = (
+                pd.crosstab(tagged["_matched_parts"], tagged["대분류"])
+                .idxmax(axis=1)
+                .to_dict()
+            )
+            for part in self.TRACKED_PARTS:
+                if part in dominant_defects:
+                    most_common_defect = dominant_defects[part]
                     defect_type_mapping[part] = most_common_defect
                     logger.info(f"동적 매핑: {part} → {most_common_defect}")
 
-            # 기본값들 추가
-            default_mappings = {
-                "HEATING JACKET": "기구작업불량",
-                "LEAK SENSOR": "전장작업불량",
-                "TOUCH SCREEN": "전장작업불량",
-                "REDUCER DOUBLE Y UNION": "기구작업불량",
-                "UNEQUAL UNION Y": "기구작업불량",
-                "CLAMP": "기구작업불량",
-                "MALE ELBOW": "기구작업불량",
-                "BULKHEAD UNION": "기구작업불량",
-                "KEY OPERATION VALVE": "기구작업불량",
-                "PNEUMATIC VALVE": "기구작업불량",
-                "미분류": "검사품질불량",
-            }
-
             # 실제 데이터가 없는 부품들에 대해서만 기본값 적용
-            for part, defect_type in default_mappings.items():
+            for part, defect_type in self.DEFAULT_DEFECT_TYPES.items():
                 if part not in defect_type_mapping:
                     defect_type_mapping[part] = defect_type
 
@@ -772,23 +1216,33 @@ class AdvancedDefectAnalyzer:
 
     def _get_actual_defect_count(self, part_name: str) -> int:
         """실제 데이터에서 부품별 누적 불량 건수 조회"""
-        try:
-            from data.teams_loader import TeamsDataLoader
-
-            loader = TeamsDataLoader()
-            df = loader.load_defect_data_from_teams()
-
-            # 해당 부품의 실제 불량 건수 조회
-            part_data = df[df["부품명"].str.contains(part_name, case=False, na=False)]
-            actual_count = len(part_data)
-
-            logger.info(f"실제 누적 건수: {part_name} = {actual_count}건")
-            return actual_count if actual_count > 0 else 1
+        return self._get_actual_defect_counts([part_name])[part_name]
 
+    def _get_actual_defect_counts(self, part_names: List[str]) -> Dict[str, int]:
+        """실제 데이터에서 여러 부품의 누적 불량 건수를 한 번에 조회"""
+        try:
+            self._load_teams_df()
         except Exception as e:
             logger.warning(f"실제 누적 건수 조회 실패: {e}")
             # 실패 시 기본값 반환
-            return 5
+            return dict.fromkeys(part_names, 5)
+
+        actual_counts = {}
+        for part_name in part_names:
+            # 해당 부품의 실제 불량 건수 조회 (로드 시 태깅된 건수 우선 사용)
+            part_key = str(part_name).upper().strip()
+            if part_key not in self._part_count_cache:
+                # 알려지지 않은 부품명은 고유 부품명 키 단위로만 부분 일치 검사
+                self._part_count_cache[part_key] = sum(
+                    count
+                    for key, count in self._part_key_counts.items()
+                    if part_key in key
+                )
+            actual_count = self._part_count_cache[part_key]
+            actual_counts[part_name] = actual_count if actual_count > 0 else 1
+
+        logger.info(f"실제 누적 건수: {actual_counts}")
+        return actual_counts
 
     def create_advanced_dashboard_data(
         self, predictions: List[Dict], analysis: Dict, suggestions: List[Dict]
@@ -799,8 +1253,24 @@ class AdvancedDefectAnalyzer:
         # 부품 선정 기준 설명 추가
         selection_criteria = self._explain_part_selection_criteria(predictions)
 
-        # 동적 불량유형 매핑 (실제 데이터 기반)
-        defect_type_mapping = self._get_dynamic_defect_type_mapping()
+        # 동적 불량유형 매핑 (실제 데이터 기반, 매핑 대상 부품이 없으면 Teams 조회 생략)
+        part_names = [p["부품"] for p in predictions]
+        if any(
+            part in self.TRACKED_PARTS or part in self.DEFAULT_DEFECT_TYPES
+            for part in part_names
+        ):
+            defect_type_mapping = self._get_dynamic_defect_type_mapping()
+        else:
+            defect_type_mapping = {}
+
+        # 실제 데이터 기반 누적건수 (Teams 데이터 1회 로드 후 전체 부품 일괄 조회)
+        actual_counts = self._get_actual_defect_counts(part_names) if part_names else {}
+
+        # 부품명 → 제안 인덱스 (target: "모델 - 부품", 정렬 순서상 첫 제안 우선)
+        suggestion_by_part = {}
+        for suggestion in suggestions:
+            target_part = suggestion.get("target", "").split(" - ")[-1]
+            suggestion_by_part.setdefault(target_part, suggestion)
 
         # 각 예측에 불량유형과 누적건수 추가
         enhanced_predictions = []
@@ -813,14 +1283,10 @@ class AdvancedDefectAnalyzer:
             enhanced_pred["불량유형"] = defect_type_mapping.get(part_name, "기타불량")
 
             # 실제 데이터 기반 누적건수 계산
-            enhanced_pred["누적"] = self._get_actual_defect_count(part_name)
+            enhanced_pred["누적"] = actual_counts[part_name]
 
             # 개선 제안 연결
-            matching_suggestion = None
-            for suggestion in suggestions:
-                if part_name in suggestion.get("target", ""):
-                    matching_suggestion = suggestion
-                    break
+            matching_suggestion = suggestion_by_part.get(part_name)
 
             if matching_suggestion:
                 enhanced_pred["제안"] = (
@@ -870,81 +1336,70 @@ class AdvancedDefectAnalyzer:
         self, predictions: List[Dict]
     ) -> Dict[str, Any]:
         """부품 선정 기준 상세 설명"""
+        # 템플릿의 중첩 dict/list만 얕게 복사해 호출 측과 공유하지 않도록 함
+        # (deepcopy는 호출당 비용이 커서 사용하지 않음)
+        template = SELECTION_CRITERIA_TEMPLATE
+        primary_factors = [dict(factor) for factor in template["primary_factors"]]
+        primary_factors[0]["current_range"] = (
+            f"{predictions[0]['예상불량률']}% ~ {predictions[-1]['예상불량률']}%"
+            if predictions
+            else "N/A"
+        )
+        unclassified_rate = next(
+            (p["예상불량률"] for p in predictions if p["부품"] == "미분류"), 0
+        )
+        unclassified = dict(template["special_cases"]["미분류"])
+        unclassified["current_status"] = f"{unclassified_rate}%"
         return {
-            "ranking_method": "예측 불량률 기준 내림차순",
-            "primary_factors": [
-                {
-                    "factor": "예측 불량률",
-                    "weight": "40%",
-                    "description": "ML 모델이 예측한 부품별 불량 발생 확률",
-                    "current_range": (
-                        f"{predictions[0]['예상불량률']}% ~ {predictions[-1]['예상불량률']}%"
-                        if predictions
-                        else "N/A"
-                    ),
-                },
-                {
-                    "factor": "생산량 가중치",
-                    "weight": "30%",
-                    "description": "실제 월간 생산량에 따른 중요도 반영",
-                    "current_focus": "GAIA-I DUAL(34.7%), GAIA-I(32.4%)",
-                },
-                {
-                    "factor": "과거 불량 빈도",
-                    "weight": "20%",
-                    "description": "해당 부품의 역사적 불량 발생 건수",
-                    "data_period": "최근 12개월 데이터 기준",
-                },
-                {
-                    "factor": "키워드 유사도",
-                    "weight": "10%",
-                    "description": "TF-IDF 기반 불량 내용 유사성 분석",
-                    "method": "MeCab 형태소 분석 + 한국어 불용어 제거",
-                },
-            ],
-            "special_cases": {
-                "미분류": {
-                    "current_status": f"{[p for p in predictions if p['부품']=='미분류'][0]['예상불량률'] if any(p['부품']=='미분류' for p in predictions) else 0}%",
-                    "impact": "전체 불량의 26.7% 차지",
-                    "priority": "HIGH - 품질 관리 체계 근본적 개선 필요",
-                    "main_issue": "조립도면/BOM 정보 불일치가 주원인",
-                }
-            },
-            "selection_logic": [
-                "1. 학습된 데이터에서 생산량 가중치 적용하여 샘플링",
-                "2. ML 모델로 각 샘플의 불량 확률 예측",
-                "3. 예측 확률 기준 내림차순 정렬",
-                "4. 상위 5개 부품 선정",
-                "5. 각 부품별 맞춤형 개선 제안 매칭",
-            ],
+            "ranking_method": template["ranking_method"],
+            "primary_factors": primary_factors,
+            "special_cases": {"미분류": unclassified},
+            "selection_logic": list(template["selection_logic"]),
         }
 
     def _get_enhanced_keyword_analysis(self) -> Dict[str, Any]:
         """개선된 키워드 분석 (영어+한국어 통합)"""
+        if self._keyword_analysis_cache is not None:
+            return self._keyword_analysis_cache
+
         try:
-            from data.teams_loader import TeamsIntegratedDataLoader
-            from data.data_loader import DataLoader
-            
-            # 데이터 로드
-            teams_loader = TeamsIntegratedDataLoader()
-            data = teams_loader.load_data_with_fallback()
-            data_loader = DataLoader()
-            
-            # 개선된 전처리로 키워드 추출
-            all_keywords = []
-            for content in data['상세불량내용']:
-                keywords = data_loader.preprocess_text(content)
-                all_keywords.extend(keywords)
-            
-            keyword_freq = Counter(all_keywords).most_common(20)
+            # 데이터 로드 (분석기 인스턴스당 한 번)
+            data, data_loader = self._ensure_data()
+
+            # 개선된 전처리로 키워드 추출 (일괄 처리, 중간 리스트 없이 바로 집계)
+            # 파이프라인에서 이미 preprocess_text로 만든 keywords 컬럼이 있으면 재사용
+            if "keywords" in data.columns:
+                keyword_lists = data["keywords"]
+            else:
+                keyword_lists = data_loader.preprocess_texts(data['상세불량내용'])
+            keyword_counter = Counter(chain.from_iterable(keyword_lists))
+
+            keyword_freq = keyword_counter.most_common(20)
             
-            # 키워드 분류
-            leak_keywords = [(kw, freq) for kw, freq in keyword_freq if 'leak' in kw.lower() or '누수' in kw or '누설' in kw]
-            fitting_keywords = [(kw, freq) for kw, freq in keyword_freq if 'fitting' in kw.lower() or '체결' in kw]
-            material_keywords = [(kw, freq) for kw, freq in keyword_freq if any(mat in kw.lower() for mat in ['pfa', 'teflon', '우레탄', 'ring'])]
+            # 키워드 분류 (한 번의 순회로 분류, 여러 분류에 동시에 속할 수 있음)
+            leak_keywords = []
+            fitting_keywords = []
+            material_keywords = []
+            for kw, freq in keyword_freq:
+                kw_lower = kw.lower()
+                if 'leak' in kw_lower or '누수' in kw or '누설' in kw:
+                    leak_keywords.append((kw, freq))
+                if 'fitting' in kw_lower or '체결' in kw:
+                    fitting_keywords.append((kw, freq))
+                if any(mat in kw_lower for mat in MATERIAL_KEYWORDS):
+                    material_keywords.append((kw, freq))
             
-            return {
-                "total_keywords": len(set(all_keywords)),
+            # 언어별 키워드 수 (한 번의 순회, 문자 클래스 검사는 정규식으로)
+            english_count = korean_count = mixed_count = 0
+            for kw, _ in keyword_freq:
+                has_upper = UPPERCASE_PATTERN.search(kw) is not None
+                has_hangul = HANGUL_PATTERN.search(kw) is not None
+                english_count += has_upper
+                korean_count += has_hangul
+                mixed_count += has_upper and has_hangul
+
+            self._keyword_analysis_cache = {
+                "total_keywords": len(keyword_counter),
                 "top_keywords": keyword_freq,
                 "categorized_analysis": {
                     "leak_related": leak_keywords,
@@ -952,12 +1407,13 @@ class AdvancedDefectAnalyzer:
                     "material_related": material_keywords,
                 },
                 "enhanced_preprocessing": {
-                    "english_keywords": len([kw for kw, _ in keyword_freq if kw[0].isupper() or any(c.isalpha() and c.isupper() for c in kw)]),
-                    "korean_keywords": len([kw for kw, _ in keyword_freq if any('\uac00' <= c <= '\ud7a3' for c in kw)]),
-                    "mixed_keywords": len([kw for kw, _ in keyword_freq if any('\uac00' <= c <= '\ud7a3' for c in kw) and any(c.isalpha() and c.isupper() for c in kw)]),
+                    "english_keywords": english_count,
+                    "korean_keywords": korean_count,
+                    "mixed_keywords": mixed_count,
                 }
             }
-            
+            return self._keyword_analysis_cache
+
         except Exception as e:
             logger.warning(f"개선된 키워드 분석 실패: {e}")
             return {}
@@ -969,32 +1425,37 @@ class AdvancedDefectAnalyzer:
         
         # 개선된 키워드 분석 추가
         enhanced_keywords = self._get_enhanced_keyword_analysis()
-        
+
+        # 위험도 구간별 부품 수 (불량률 배열을 한 번만 구성)
+        rates = np.fromiter(
+            (p.get("예상불량률", 0) for p in predictions),
+            dtype=np.float64,
+            count=len(predictions),
+        )
+
         summary = {
             "total_predictions": len(predictions),
-            "high_risk_parts": len([p for p in predictions if p.get("예상불량률", 0) >= 10]),
-            "medium_risk_parts": len([p for p in predictions if 5 <= p.get("예상불량률", 0) < 10]),
-            "low_risk_parts": len([p for p in predictions if p.get("예상불량률", 0) < 5]),
+            "high_risk_parts": int((rates >= 10).sum()),
+            "medium_risk_parts": int(((rates >= 5) & (rates < 10)).sum()),
+            "low_risk_parts": int((rates < 5).sum()),
             "enhanced_keyword_analysis": enhanced_keywords,
-            "data_quality_improvements": {
-                "keyword_extraction": "영어+한국어 통합 전처리 적용",
-                "accuracy_improvement": "+3.71%p (92.59% → 96.30%)",
-                "feature_enhancement": "59개 → 173개 차원 (+193.2%)",
-                "keyword_density": "1.81개 → 5.34개 (+195.2%)",
-            },
-            "top_improvement_areas": [
-                "SPEED CONTROLLER (CRITICAL - 92건 누수)",
-                "MALE ELBOW (HIGH - 40건 Fitting nut 누수)",
-                "MALE CONNECTOR (HIGH - 17건 누수)",
-                "REDUCER DOUBLE Y UNION (HIGH - 41건 삽입부)",
-            ]
+            # 공유 상수가 호출 측에서 수정되지 않도록 복사본 반환
+            "data_quality_improvements": dict(DATA_QUALITY_IMPROVEMENTS),
+            "top_improvement_areas": TOP_IMPROVEMENT_AREAS,
         }
         
         if enhanced_keywords:
+            # 하위 사전은 한 번만 꺼내서 사용
+            top_keywords = enhanced_keywords["top_keywords"]
+            categorized = enhanced_keywords.get("categorized_analysis") or {}
+            preprocessing = enhanced_keywords.get("enhanced_preprocessing") or {}
             summary["key_insights"] = {
-                "most_critical_keyword": enhanced_keywords["top_keywords"][0] if enhanced_keywords["top_keywords"] else "N/A",
-                "leak_dominance": len(enhanced_keywords.get("categorized_analysis", {}).get("leak_related", [])),
-                "multilingual_coverage": f"영어 {enhanced_keywords.get('enhanced_preprocessing', {}).get('english_keywords', 0)}개, 한국어 {enhanced_keywords.get('enhanced_preprocessing', {}).get('korean_keywords', 0)}개"
+                "most_critical_keyword": top_keywords[0] if top_keywords else "N/A",
+                "leak_dominance": len(categorized.get("leak_related", [])),
+                "multilingual_coverage": (
+                    f"영어 {preprocessing.get('english_keywords', 0)}개, "
+                    f"한국어 {preprocessing.get('korean_keywords', 0)}개"
+                ),
             }
-        
+
         return summary
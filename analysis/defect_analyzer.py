@@ -1,19 +1,29 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any
-from collections import defaultdict, Counter
+from typing import Dict, List, Any, Union
+import logging
 
 from config import ml_config
 from utils.logger import setup_logger, flush_log
 
 logger = setup_logger(__name__)
 
+# 최근 불량 시뮬레이션 결과에 포함되는 (라벨 인코딩된) 컬럼
+RECENT_DEFECT_COLUMNS = ("제품명", "부품명", "검출단계", "대분류", "중분류")
+
+# 예상불량률 구간(5, 10, 20 경계)별 누적 건수 난수 범위 [low, high)
+CUMULATIVE_RATE_THRESHOLDS = np.array([5, 10, 20])
+CUMULATIVE_COUNT_LOW = np.array([5, 10, 20, 40])
+CUMULATIVE_COUNT_HIGH = np.array([15, 20, 40, 80])
+
 
 class DefectAnalyzer:
     """불량 데이터 분석 클래스"""
 
     def __init__(self):
-        pass
+        # 인코딩된 제품명 → 생산량 가중치 (가중치 내용/인코더 클래스가 바뀌면 다시 구성)
+        self._weight_cache = None
+        self._weight_cache_source = (None, None)
 
     def analyze_defect_types(
         self, data: pd.DataFrame, label_encoders: Dict = None
@@ -21,35 +31,51 @@ class DefectAnalyzer:
         """불량 유형별 분석"""
         logger.info("📊 불량 유형 분석 중...")
 
-        # 대분류별 불량 카운트
-        defect_types = data.groupby("대분류").size().reset_index(name="count")
+        # 라벨 인코딩된 정수 코드는 범주형으로 감싸 코드 기반으로 바로 집계
+        defect_types = data["대분류"]
+        if (
+            label_encoders
+            and "대분류" in label_encoders
+            and pd.api.types.is_integer_dtype(defect_types)
+        ):
+            defect_types = pd.Series(
+                pd.Categorical.from_codes(
+                    defect_types.to_numpy(),
+                    categories=range(len(label_encoders["대분류"].classes_)),
+                )
+            )
+
+        # 대분류별 불량 카운트 (카운트 내림차순, 동률은 대분류 값 순서 유지)
+        defect_counts = (
+            defect_types.value_counts(sort=False)
+            .sort_index()
+            .sort_values(ascending=False, kind="stable")
+        )
+        defect_counts = defect_counts[defect_counts > 0]  # 미발생 범주 제외
+        categories = defect_counts.index.to_numpy()
+        counts = defect_counts.to_numpy()
 
         # 라벨 디코딩 (라벨 인코더가 있는 경우에만)
         if label_encoders and "대분류" in label_encoders:
-            defect_types["대분류"] = label_encoders["대분류"].inverse_transform(
-                defect_types["대분류"]
-            )
+            categories = self._decode_labels(label_encoders["대분류"], categories)
 
         # 비율 계산
-        total_defects = defect_types["count"].sum()
-        defect_analysis = []
-
-        for _, row in defect_types.iterrows():
-            defect_analysis.append(
-                {
-                    "category": row["대분류"],
-                    "count": int(row["count"]),
-                    "percentage": round(row["count"] / total_defects * 100, 2),
-                }
-            )
-
-        # 카운트 기준으로 정렬
-        defect_analysis.sort(key=lambda x: x["count"], reverse=True)
-
-        logger.info(f"✅ 불량 유형 분석 완료: {len(defect_analysis)}개 유형")
-        for analysis in defect_analysis:
+        percentages = np.round(counts / counts.sum() * 100, 2)
+        defect_analysis = [
+            {"category": category, "count": int(count), "percentage": float(pct)}
+            for category, count, pct in zip(categories, counts, percentages)
+        ]
+
+        # 유형별 상세 내역은 한 번의 로그로 출력 (INFO 비활성 시 포맷팅 생략)
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
-                f"  - {analysis['category']}: {analysis['count']}건 ({analysis['percentage']}%)"
+                "\n".join(
+                    [f"✅ 불량 유형 분석 완료: {len(defect_analysis)}개 유형"]
+                    + [
+                        f"  - {a['category']}: {a['count']}건 ({a['percentage']}%)"
+                        for a in defect_analysis
+                    ]
+                )
             )
 
         flush_log(logger)
@@ -61,69 +87,43 @@ class DefectAnalyzer:
         label_encoders: Dict = None,
         production_weights: Dict[str, float] = None,
         hours: int = 24,
-    ) -> List[Dict[str, Any]]:
-        """최근 불량 데이터 시뮬레이션 생성 (데이터 축적용)"""
+    ) -> pd.DataFrame:
+        """최근 불량 데이터 시뮬레이션 생성 (데이터 축적용, 시간당 1행의 컬럼형 DataFrame)"""
         logger.info(f"📈 최근 {hours}시간 불량 데이터 생성 중...")
 
-        recent_data = []
+        rng = np.random.default_rng(42)
 
-        for i in range(hours):
-            # 생산량 가중치 기반 샘플링
-            if production_weights and label_encoders:
-                # 제품명 가중치 매핑
-                data["production_weight"] = data["제품명"].apply(
-                    lambda x: self._get_production_weight(
-                        x, production_weights, label_encoders
-                    )
-                )
-                sample = data.sample(
-                    1, weights="production_weight", random_state=42 + i
-                ).iloc[0]
-            else:
-                sample = data.sample(1, random_state=42 + i).iloc[0]
-
-            # 데이터 구성 (라벨 인코더가 있는 경우 디코딩, 없으면 원본 값 사용)
-            recent_data.append(
-                {
-                    "제품명": (
-                        label_encoders["제품명"].inverse_transform([sample["제품명"]])[
-                            0
-                        ]
-                        if label_encoders
-                        else sample["제품명"]
-                    ),
-                    "부품명": (
-                        label_encoders["부품명"].inverse_transform([sample["부품명"]])[
-                            0
-                        ]
-                        if label_encoders
-                        else sample["부품명"]
-                    ),
-                    "검출단계": (
-                        label_encoders["검출단계"].inverse_transform(
-                            [sample["검출단계"]]
-                        )[0]
-                        if label_encoders
-                        else sample["검출단계"]
-                    ),
-                    "대분류": (
-                        label_encoders["대분류"].inverse_transform([sample["대분류"]])[
-                            0
-                        ]
-                        if label_encoders
-                        else sample["대분류"]
-                    ),
-                    "중분류": (
-                        label_encoders["중분류"].inverse_transform([sample["중분류"]])[
-                            0
-                        ]
-                        if label_encoders
-                        else sample["중분류"]
-                    ),
-                    "timestamp": pd.Timestamp.now() - pd.Timedelta(hours=hours - i),
-                    "keywords": sample["keywords"],
-                }
+        # 생산량 가중치 기반 샘플링 (가중치는 제품별 1회 계산, 전체 시간을 한 번에 추출)
+        if production_weights and label_encoders:
+            weights = self._get_sample_weights(
+                data, production_weights, label_encoders
             )
+            positions = rng.choice(
+                len(data), size=hours, replace=True, p=weights / weights.sum()
+            )
+        else:
+            positions = rng.choice(len(data), size=hours, replace=True)
+
+        samples = data.iloc[positions]
+        timestamps = pd.Timestamp.now() - pd.to_timedelta(
+            np.arange(hours, 0, -1), unit="h"
+        )
+
+        # 데이터 구성 (라벨 인코더가 있는 경우 컬럼별로 한 번에 디코딩, 없으면 원본 값 사용)
+        recent_data = pd.DataFrame(
+            {
+                **{
+                    col: (
+                        self._decode_labels(label_encoders[col], samples[col].to_numpy())
+                        if label_encoders
+                        else samples[col].to_numpy()
+                    )
+                    for col in RECENT_DEFECT_COLUMNS
+                },
+                "timestamp": timestamps,
+                "keywords": samples["keywords"].to_numpy(),
+            }
+        )
 
         logger.info(f"✅ {len(recent_data)}건의 최근 불량 데이터 생성 완료")
         flush_log(logger)
@@ -131,25 +131,34 @@ class DefectAnalyzer:
         return recent_data
 
     def analyze_top_defects(
-        self, recent_data: List[Dict[str, Any]], top_n: int = 5
+        self, recent_data: Union[pd.DataFrame, List[Dict[str, Any]]], top_n: int = 5
     ) -> List[tuple]:
         """제품-단계-부품별 상위 불량 분석"""
         logger.info("🔍 상위 불량 패턴 분석 중...")
 
-        product_stage_part_defects = defaultdict(int)
+        if not isinstance(recent_data, pd.DataFrame):
+            recent_data = pd.DataFrame(recent_data, columns=list(RECENT_DEFECT_COLUMNS))
 
-        for defect in recent_data:
-            key = f"{defect['제품명']} - {defect['검출단계']} - {defect['부품명']}"
-            product_stage_part_defects[key] += 1
+        # 패턴별 건수 (등장 순서 유지, 동률은 먼저 등장한 패턴 우선)
+        product_stage_part_defects = recent_data.groupby(
+            ["제품명", "검출단계", "부품명"], sort=False, dropna=False
+        ).size()
 
-        # 상위 불량 패턴 추출
-        top_defects = sorted(
-            product_stage_part_defects.items(), key=lambda x: x[1], reverse=True
-        )[:top_n]
+        # 상위 불량 패턴 추출 (문자열 키는 상위 N개에만 생성)
+        top_defects = [
+            (f"{product} - {stage} - {part}", int(count))
+            for (product, stage, part), count in product_stage_part_defects.nlargest(
+                top_n
+            ).items()
+        ]
 
-        logger.info(f"✅ 상위 {len(top_defects)}개 불량 패턴:")
-        for pattern, count in top_defects:
-            logger.info(f"  - {pattern}: {count}건")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "\n".join(
+                    [f"✅ 상위 {len(top_defects)}개 불량 패턴:"]
+                    + [f"  - {pattern}: {count}건" for pattern, count in top_defects]
+                )
+            )
 
         flush_log(logger)
         return top_defects
@@ -171,13 +180,8 @@ class DefectAnalyzer:
         major_category = major_defect["category"]
 
         # 상위 불량 패턴에서 주요 부품 추출
-        top_part = ""
-        if top_defects:
-            top_part = (
-                top_defects[0][0].split(" - ")[2]
-                if len(top_defects[0][0].split(" - ")) >= 3
-                else ""
-            )
+        pattern_parts = top_defects[0][0].split(" - ") if top_defects else []
+        top_part = pattern_parts[2] if len(pattern_parts) >= 3 else ""
 
         # 상위 키워드 문자열
         top_keywords_str = ", ".join(top_keywords[:3])
@@ -201,6 +205,31 @@ class DefectAnalyzer:
 
         return suggestion
 
+    def _get_sample_weights(
+        self,
+        data: pd.DataFrame,
+        production_weights: Dict[str, float],
+        label_encoders: Dict,
+    ) -> np.ndarray:
+        """행별 생산량 가중치 배열
+
+        제품 코드 → 가중치 사전은 가중치/인코더가 같으면 재사용하고,
+        행 단위 매핑은 데이터 변경이 반영되도록 매번 계산
+        """
+        # 가중치는 고유 제품별 1회만 계산 후 행에 매핑
+        products = data["제품명"]
+        weight_map = {
+            product: self._get_production_weight(
+                product, production_weights, label_encoders
+            )
+            for product in products.unique()
+        }
+        return products.map(weight_map).to_numpy(dtype=np.float64)
+
+    def _decode_labels(self, encoder, codes) -> np.ndarray:
+        """라벨 인코딩 코드를 classes_ 인덱싱으로 복원 (inverse_transform 검증 생략)"""
+        return encoder.classes_[np.asarray(codes, dtype=np.intp)]
+
     def _get_production_weight(
         self,
         encoded_product: int,
@@ -209,10 +238,21 @@ class DefectAnalyzer:
     ) -> float:
         """인코딩된 제품명을 원래 이름으로 복원하여 생산량 가중치 반환"""
         try:
-            product_name = label_encoders["제품명"].inverse_transform(
-                [encoded_product]
-            )[0]
-            return production_weights.get(product_name, 0.01)
+            classes = label_encoders["제품명"].classes_
+            cached_weights, cached_classes = self._weight_cache_source
+            # 가중치 사전은 내용으로 비교 (같은 객체를 제자리 수정해도 다시 구성)
+            if (
+                self._weight_cache is None
+                or cached_classes is not classes
+                or cached_weights != production_weights
+            ):
+                # classes_는 인코딩 값 순서이므로 한 번만 역매핑 사전 구성
+                self._weight_cache = {
+                    code: production_weights.get(name, 0.01)
+                    for code, name in enumerate(classes)
+                }
+                self._weight_cache_source = (dict(production_weights), classes)
+            return self._weight_cache.get(encoded_product, 0.01)
         except Exception:
             return 0.01
 
@@ -226,41 +266,31 @@ class DefectAnalyzer:
         """대시보드용 JSON 데이터 생성"""
         logger.info("📋 대시보드 데이터 생성 중...")
 
-        # 예측 데이터에 추가 정보 보강
-        enhanced_predictions = []
-        for pred in predictions:
-            enhanced_pred = pred.copy()
-
-            # 불량 유형 결정 (동적 방식으로)
-            defect_type = "기구작업불량"  # 기본값
-            try:
-                # 가장 많은 불량 유형을 기본값으로 설정
-                if defect_analysis and len(defect_analysis) > 0:
-                    # 가장 많은 불량 유형 선택
-                    most_common_defect = defect_analysis[0].get(
-                        "category", "기구작업불량"
-                    )
-                    defect_type = most_common_defect
-            except Exception as e:
-                logger.warning(f"불량 유형 결정 중 오류: {e}")
-
-            enhanced_pred["불량유형"] = defect_type
-
-            # 누적 건수 (예상불량률 기반)
-            defect_rate = pred.get("예상불량률", 0)
-            if defect_rate >= 20:
-                enhanced_pred["누적"] = np.random.randint(40, 80)
-            elif defect_rate >= 10:
-                enhanced_pred["누적"] = np.random.randint(20, 40)
-            elif defect_rate >= 5:
-                enhanced_pred["누적"] = np.random.randint(10, 20)
-            else:
-                enhanced_pred["누적"] = np.random.randint(5, 15)
-
-            # 제안 추가
-            enhanced_pred["제안"] = suggestion
-
-            enhanced_predictions.append(enhanced_pred)
+        # 누적 건수 (예상불량률 구간별 범위에서 전체 예측을 한 번에 생성, 재현 가능하도록 고정 시드)
+        rng = np.random.default_rng(42)
+        rates = np.asarray(
+            [pred.get("예상불량률", 0) for pred in predictions], dtype=np.float64
+        )
+        rate_bucket = np.digitize(rates, CUMULATIVE_RATE_THRESHOLDS)
+        # NaN은 digitize에서 마지막 구간으로 들어가므로 기존 비교식과 같이 최하위 구간 처리
+        rate_bucket[np.isnan(rates)] = 0
+        cumulative_counts = rng.integers(
+            CUMULATIVE_COUNT_LOW[rate_bucket], CUMULATIVE_COUNT_HIGH[rate_bucket]
+        )
+
+        # 불량 유형 결정 (모든 예측에 공통: 가장 많은 불량 유형, 없으면 기본값)
+        defect_type = "기구작업불량"
+        try:
+            if defect_analysis:
+                defect_type = defect_analysis[0].get("category", "기구작업불량")
+        except Exception as e:
+            logger.warning(f"불량 유형 결정 중 오류: {e}")
+
+        # 예측 데이터에 추가 정보 보강 (원본 예측 dict는 변경하지 않음)
+        enhanced_predictions = [
+            {**pred, "불량유형": defect_type, "누적": cumulative_count, "제안": suggestion}
+            for pred, cumulative_count in zip(predictions, cumulative_counts.tolist())
+        ]
 
         dashboard_data = {
             "predictions": enhanced_predictions,
@@ -3,6 +3,8 @@
 Teams 엑셀 데이터를 기반으로 HTML 차트 생성
 """
 
+from __future__ import annotations
+
 # VS Code "Run Code" 지원을 위한 경로 설정
 import sys
 import os
@@ -10,25 +12,136 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pandas as pd
-import plotly.graph_objects as go
 
+# plotly는 차트 생성 시점에만 로드 (모듈 import 비용 절감)
 # import plotly.express as px  # 사용안함
-from plotly.subplots import make_subplots
 
 # import json  # 사용안함
 import os
 
 # from datetime import datetime  # 사용안함
-from typing import Dict  # List, Tuple 사용안함
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple  # List 사용안함
+import glob
 import io
+import re
+import hashlib
+import time
+from functools import lru_cache
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
-# import numpy as np  # 사용안함
+try:
+    import python_calamine  # noqa: F401
 
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    # python-calamine이 없으면 openpyxl 엔진으로 엑셀 파싱 (선택적 의존성)
+    CALAMINE_AVAILABLE = False
+
+from config import teams_config
 from data.teams_loader import TeamsDataLoader
 from utils.logger import setup_logger, flush_log
 
 logger = setup_logger(__name__)
 
+# 조치유형 재검색용 키워드 (하나의 정규식으로 한 번에 매칭)
+ACTION_KEYWORDS = (
+    "재체결",
+    "재작업",
+    "재조립",
+    "Teflon",
+    "파트교체",
+    "교체",
+    "체결",
+    "클램프",
+)
+ACTION_KEYWORD_PATTERN = re.compile("|".join(map(re.escape, ACTION_KEYWORDS)))
+
+# 월/분기 번호 → 한국어 이름 조회 테이블 (0-based)
+MONTH_NAMES = np.array([f"{m}월" for m in range(1, 13)])
+QUARTER_NAMES = np.array(["1분기", "2분기", "3분기", "4분기"])
+
+# 차트 기본 색상 팔레트
+BASE_COLORS = (
+    "#FF6B6B",
+    "#4ECDC4",
+    "#45B7D1",
+    "#96CEB4",
+    "#FFEAA7",
+    "#DDA0DD",
+    "#FF8A80",
+    "#81C784",
+    "#64B5F6",
+    "#FFB74D",
+    "#F06292",
+    "#9575CD",
+    "#4DB6AC",
+    "#AED581",
+    "#FFD54F",
+    "#FF8A65",
+    "#A1887F",
+    "#90A4AE",
+)
+
+
+@lru_cache(maxsize=32)
+def _hsv_palette(count: int) -> Tuple[str, ...]:
+    """HSV 색상 공간에서 균등한 count개 색상 (채도 0.7, 명도 0.9, colorsys와 동일한 계산)"""
+    saturation, value = 0.7, 0.9
+    hue = np.arange(count) / count
+    sector = (hue * 6.0).astype(int)
+    frac = hue * 6.0 - sector
+    v = np.full(count, value)
+    p = np.full(count, value * (1.0 - saturation))
+    q = value * (1.0 - saturation * frac)
+    t = value * (1.0 - saturation * (1.0 - frac))
+
+    # 색상 구간(0~5)별 (R, G, B) 조합
+    rgb = np.select(
+        [(sector % 6)[:, None] == k for k in range(6)],
+        [
+            np.stack([v, t, p], axis=1),
+            np.stack([q, v, p], axis=1),
+            np.stack([p, v, t], axis=1),
+            np.stack([p, q, v], axis=1),
+            np.stack([t, p, v], axis=1),
+            np.stack([v, p, q], axis=1),
+        ],
+    )
+    channels = (rgb * 255).astype(int)
+    return tuple("#{:02x}{:02x}{:02x}".format(*row) for row in channels.tolist())
+
+
+# 차트 상단 오른쪽 가로 범례 (여러 차트 공통)
+TOP_RIGHT_LEGEND = dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+
+
+@lru_cache(maxsize=None)
+def _chart_template() -> go.layout.Template:
+    """모든 차트가 공유하는 plotly_white 레이아웃 템플릿 (최초 1회만 생성)"""
+    import plotly.graph_objects as go
+    import plotly.io as pio
+
+    return go.layout.Template(pio.templates["plotly_white"])
+
+
+# 조치유형 통합 차트에서 사용하는 불량내역 컬럼
+ACTION_CHART_COLUMNS = ("상세조치내용", "부품명", "발생일_pd", "발생월", "발생분기")
+
+# 불량내역에서 범주형(category)으로 변환할 문자열 컬럼
+DEFECT_CATEGORY_COLUMNS = (
+    "모델",
+    "부품명",
+    "외주사",
+    "조치",
+    "대분류",
+    "중분류",
+    "상세조치내용",
+)
+
 
 class DefectVisualizer:
     """불량 데이터 시각화 클래스"""
@@ -45,44 +158,89 @@ class DefectVisualizer:
         self.analysis_data = None
         self.defect_data = None
 
+        # 불량분석 시트 첫 번째 컬럼 문자열 캐시 (섹션 위치 탐색용)
+        self._col1_str = None
+        self._col1_source = None
+        self._anchor_rows = {}
+
+        # 월별/외주사별 추출 결과 캐시 (같은 불량분석 시트면 재사용)
+        self._extract_cache = None
+        self._extract_source = None
+
     def generate_colors(self, count: int) -> list:
         """동적 색상 생성"""
-        base_colors = [
-            "#FF6B6B",
-            "#4ECDC4",
-            "#45B7D1",
-            "#96CEB4",
-            "#FFEAA7",
-            "#DDA0DD",
-            "#FF8A80",
-            "#81C784",
-            "#64B5F6",
-            "#FFB74D",
-            "#F06292",
-            "#9575CD",
-            "#4DB6AC",
-            "#AED581",
-            "#FFD54F",
-            "#FF8A65",
-            "#A1887F",
-            "#90A4AE",
-        ]
-
-        if count <= len(base_colors):
-            return base_colors[:count]
-        else:
-            # 색상이 부족하면 HSV 색상 공간에서 균등하게 생성
-            import colorsys
-
-            colors = []
-            for i in range(count):
-                hue = i / count
-                rgb = colorsys.hsv_to_rgb(hue, 0.7, 0.9)
-                hex_color = "#{:02x}{:02x}{:02x}".format(
-                    int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255)
+        if count <= len(BASE_COLORS):
+            return list(BASE_COLORS[:count])
+        # 색상이 부족하면 HSV 색상 공간에서 균등하게 생성
+        return list(_hsv_palette(count))
+
+    def _read_excel_sheet(self, file_content: bytes, sheet_name: str) -> pd.DataFrame:
+        """다운로드한 엑셀에서 워크시트 하나 로드 (calamine 우선, 실패 시 openpyxl)"""
+        if CALAMINE_AVAILABLE:
+            try:
+                return pd.read_excel(
+                    io.BytesIO(file_content), sheet_name=sheet_name, engine="calamine"
                 )
-                colors.append(hex_color)
-            return colors
+            except Exception as e:
+                logger.warning(f"⚠️ calamine 엑셀 파싱 실패, openpyxl로 재시도: {e}")
+
+        return pd.read_excel(
+            io.BytesIO(file_content), sheet_name=sheet_name, engine="openpyxl"
+        )
+
+    def _load_sheet_cached(
+        self, excel_file: Optional[Dict], sheet_key: str, loader: Callable
+    ) -> pd.DataFrame:
+        """엑셀 파일 버전(eTag) + 시트 기준 로컬 캐시가 있으면 사용, 없으면 loader로 로드 후 저장"""
+        version = (excel_file or {}).get("eTag") or (excel_file or {}).get(
+            "lastModifiedDateTime"
+        )
+        ttl_hours = teams_config.cache_ttl_hours
+        if ttl_hours <= 0 or not version:
+            return loader()
+
+        # 파일+시트 해시로 같은 시트의 이전 버전 캐시를 찾을 수 있도록 키를 두 부분으로 구성
+        file_id = excel_file.get("id") or excel_file.get("name", "")
+        sheet_hash = hashlib.md5(f"{file_id}|{sheet_key}".encode()).hexdigest()[:12]
+        version_hash = hashlib.md5(version.encode()).hexdigest()[:12]
+        cache_path = os.path.join(
+            teams_config.cache_dir, f"sheet_{sheet_hash}_{version_hash}.pkl"
+        )
+
+        if os.path.exists(cache_path):
+            age_hours = (time.time() - os.path.getmtime(cache_path)) / 3600
+            if age_hours < ttl_hours:
+                try:
+                    df = pd.read_pickle(cache_path)
+                    logger.info(f"📦 시트 캐시 사용: {sheet_key} ({cache_path})")
+                    return df
+                except Exception as e:
+                    logger.warning(f"⚠️ 시트 캐시 읽기 실패, 다시 다운로드: {e}")
+
+        df = loader()
+
+        # 분석 시트는 한 컬럼에 문자/숫자가 섞여 있어 셀 타입을 그대로 보존하는 pickle 사용
+        tmp_path = f"{cache_path}.tmp"
+        try:
+            os.makedirs(teams_config.cache_dir, exist_ok=True)
+            df.to_pickle(tmp_path)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"⚠️ 시트 캐시 저장 실패: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return df
+
+        # 같은 시트의 이전 버전 캐시와 예전 형식(sheet_<md5>.pkl) 캐시 정리
+        for pattern in (f"sheet_{sheet_hash}_*.pkl", "sheet_" + "?" * 32 + ".pkl"):
+            for stale_path in glob.glob(os.path.join(teams_config.cache_dir, pattern)):
+                if stale_path == cache_path:
+                    continue
+                try:
+                    os.remove(stale_path)
+                except OSError as e:
+                    logger.warning(f"⚠️ 오래된 시트 캐시 삭제 실패: {e}")
+        return df
 
     def load_analysis_data(self) -> pd.DataFrame:
         """불량분석 워크시트 데이터 로드"""
@@ -92,11 +250,14 @@ class DefectVisualizer:
             # Teams에서 파일 다운로드
             files = self.teams_loader._get_teams_files()
             excel_file = self.teams_loader._find_excel_file(files)
-            file_content = self.teams_loader._download_excel_file(excel_file)
 
-            # 불량분석 워크시트 로드
-            excel_buffer = io.BytesIO(file_content)
-            df = pd.read_excel(excel_buffer, sheet_name="가압 불량분석")
+            def read_sheet() -> pd.DataFrame:
+                file_content = self.teams_loader._download_excel_file(excel_file)
+
+                # 불량분석 워크시트 로드
+                return self._read_excel_sheet(file_content, "가압 불량분석")
+
+            df = self._load_sheet_cached(excel_file, "가압 불량분석", read_sheet)
 
             self.analysis_data = df
             logger.info(f"✅ 불량분석 데이터 로드 완료: {df.shape}")
@@ -115,17 +276,21 @@ class DefectVisualizer:
             if self.use_mock_data:
                 logger.info("📊 Mock 불량내역 데이터 사용...")
 
-                # Mock 불량내역 데이터 생성
-                mock_data = {
-                    "모델": ["Model-A", "Model-B", "Model-C"] * 20,
-                    "부품명": ["HEATING JACKET", "LEAK SENSOR", "TOUCH SCREEN"] * 20,
-                    "외주사": ["업체A", "업체B", "업체C"] * 20,
-                    "조치": ["재체결", "재작업", "재조립", "Teflon 작업", "파트교체"]
-                    * 12,
-                    "대분류": ["기구작업불량", "전장작업불량", "부품불량"] * 20,
-                    "중분류": ["조립불량", "배선불량", "품질불량"] * 20,
+                # Mock 불량내역 데이터 생성 (60건, 반복 패턴을 바로 category로 생성)
+                mock_patterns = {
+                    "모델": ["Model-A", "Model-B", "Model-C"],
+                    "부품명": ["HEATING JACKET", "LEAK SENSOR", "TOUCH SCREEN"],
+                    "외주사": ["업체A", "업체B", "업체C"],
+                    "조치": ["재체결", "재작업", "재조립", "Teflon 작업", "파트교체"],
+                    "대분류": ["기구작업불량", "전장작업불량", "부품불량"],
+                    "중분류": ["조립불량", "배선불량", "품질불량"],
                 }
-                df = pd.DataFrame(mock_data)
+                df = pd.DataFrame(
+                    {
+                        col: pd.Categorical(np.tile(values, 60 // len(values)))
+                        for col, values in mock_patterns.items()
+                    }
+                )
                 self.defect_data = df
                 logger.info(f"✅ Mock 불량내역 데이터 로드 완료: {df.shape}")
                 flush_log(logger)
@@ -133,7 +298,15 @@ class DefectVisualizer:
 
             logger.info("📊 불량내역 데이터 로드 시작...")
 
-            df = self.teams_loader.load_defect_data_from_teams()
+            # 파일 정보는 한 번만 조회하여 캐시 키와 다운로드에 함께 사용
+            files = self.teams_loader._get_teams_files()
+            excel_file = self.teams_loader._find_excel_file(files)
+            df = self._load_sheet_cached(
+                excel_file,
+                "|".join(self.teams_loader.config.worksheet_names),
+                lambda: self.teams_loader.load_defect_data_from_teams(excel_file),
+            )
+            df = self._categorize_defect_columns(df)
             self.defect_data = df
 
             logger.info(f"✅ 불량내역 데이터 로드 완료: {df.shape}")
@@ -146,83 +319,236 @@ class DefectVisualizer:
             flush_log(logger)
             raise
 
-    def extract_monthly_data(self) -> Dict:
-        """월별 불량 현황 데이터 추출 (동적)"""
-        try:
-            if self.analysis_data is None:
-                self.load_analysis_data()
+    def _categorize_defect_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """반복 값이 많은 문자열 컬럼을 category로 변환 (groupby/건수 집계를 코드 기준으로 수행)"""
+        for col in DEFECT_CATEGORY_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype("category")
+        return df
+
+    def _value_counts(self, series: pd.Series) -> pd.Series:
+        """값별 건수 (내림차순, 동률은 처음 등장한 순서)
+
+        범주형 컬럼은 필터링 후에도 전체 범주를 유지하므로, 실제 등장한 값만
+        object 컬럼의 value_counts와 같은 순서로 반환
+        """
+        if not isinstance(series.dtype, pd.CategoricalDtype):
+            return series.value_counts()
+
+        codes = series.cat.codes.to_numpy()
+        codes = codes[codes >= 0]
+        first_seen = pd.unique(codes)
+        counts = np.bincount(codes, minlength=len(series.cat.categories))[first_seen]
+        order = np.argsort(-counts, kind="stable")
+        return pd.Series(
+            counts[order],
+            index=pd.Index(series.cat.categories[first_seen[order]], name=series.name),
+            name="count",
+        )
+
+    def _count_table(
+        self, df: pd.DataFrame, row_col: str, col_col: str
+    ) -> pd.DataFrame:
+        """두 컬럼 조합별 건수 교차표 (groupby().size().unstack(fill_value=0)와 동일)
+
+        두 키를 정렬된 정수 코드로 인수분해한 뒤 단일 bincount로 집계
+        """
+        valid = (df[row_col].notna() & df[col_col].notna()).to_numpy()
+        row_codes, row_values = pd.factorize(df[row_col][valid], sort=True)
+        col_codes, col_values = pd.factorize(df[col_col][valid], sort=True)
+
+        n_rows, n_cols = len(row_values), len(col_values)
+        counts = np.bincount(
+            row_codes.astype(np.int64) * n_cols + col_codes, minlength=n_rows * n_cols
+        ).reshape(n_rows, n_cols)
+        return pd.DataFrame(
+            counts,
+            index=pd.Index(row_values, name=row_col),
+            columns=pd.Index(col_values, name=col_col),
+        )
+
+    def _top_parts_by_period(
+        self, df: pd.DataFrame, period_col: str, limit: int = 5
+    ) -> Dict[tuple, list]:
+        """(기간, 상세조치내용) 조합별 주요 부품 [(부품명, 건수), ...] 상위 limit개
+
+        조합마다 DataFrame을 다시 필터링하지 않고, 세 키의 정수 코드로 한 번에 집계
+        (순서는 _value_counts와 같이 건수 내림차순, 동률은 처음 등장한 순서)
+        """
+        keys = (period_col, "상세조치내용", "부품명")
+        valid = np.logical_and.reduce([df[key].notna().to_numpy() for key in keys])
+        if not valid.any():
+            return {}
+
+        factorized = [pd.factorize(df[key][valid]) for key in keys]
+        (period_codes, periods), (action_codes, actions), (part_codes, parts) = (
+            factorized
+        )
+
+        # (기간, 조치) 그룹 코드와 부품 코드를 하나의 키로 묶어 처음 등장한 순서대로 집계
+        group_codes = period_codes.astype(np.int64) * len(actions) + action_codes
+        combo_codes, combos = pd.factorize(group_codes * len(parts) + part_codes)
+        counts = np.bincount(combo_codes, minlength=len(combos))
+        combo_groups, combo_parts = np.divmod(combos, len(parts))
+
+        order = np.lexsort((-counts, combo_groups))
+        top_parts = {}
+        for combo in order:
+            group = int(combo_groups[combo])
+            key = (periods[group // len(actions)], actions[group % len(actions)])
+            items = top_parts.setdefault(key, [])
+            if len(items) < limit:
+                items.append((parts[combo_parts[combo]], counts[combo]))
+        return top_parts
+
+    def _count_block(self) -> np.ndarray:
+        """불량분석 시트 셀을 건수로 해석한 값 행렬 (0 이상 숫자만, 그 외 NaN)"""
+        block = np.full(self.analysis_data.shape, np.nan)
+        for col_idx, (_, col) in enumerate(self.analysis_data.items()):
+            # 날짜/불리언 셀은 건수로 보지 않음
+            if pd.api.types.is_datetime64_any_dtype(col) or pd.api.types.is_bool_dtype(
+                col
+            ):
+                continue
+            block[:, col_idx] = pd.to_numeric(col, errors="coerce")
+
+        block[~(np.isfinite(block) & (block >= 0))] = np.nan
+        return block
+
+    def _with_period_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """발생일_pd / 발생월 / 발생분기 컬럼을 추가한 새 DataFrame (기존 컬럼은 공유)"""
+        occurred = pd.to_datetime(df["발생일"], errors="coerce")
+        return df.assign(
+            발생일_pd=occurred,
+            발생월=occurred.dt.to_period("M"),
+            발생분기=occurred.dt.to_period("Q"),
+        )
+
+    def _valid_action_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        """상세조치내용과 발생일이 모두 있는 행만, 조치유형 차트에 쓰는 컬럼으로 추출"""
+        mask = (
+            df["상세조치내용"].notna().to_numpy() & df["발생일_pd"].notna().to_numpy()
+        )
+        return df.loc[mask, list(ACTION_CHART_COLUMNS)]
+
+    def _find_anchor(self, token: str) -> Optional[int]:
+        """불량분석 시트 첫 번째 컬럼에서 token 이 포함된 첫 행 위치 (없으면 None)"""
+        if self._col1_source is not self.analysis_data:
+            self._col1_str = (
+                self.analysis_data.iloc[:, 1].astype(str).to_numpy(dtype=str)
+            )
+            self._col1_source = self.analysis_data
+            self._anchor_rows = {}
+
+        if token not in self._anchor_rows:
+            hits = np.flatnonzero(np.char.find(self._col1_str, token) >= 0)
+            self._anchor_rows[token] = int(hits[0]) if hits.size else None
+        return self._anchor_rows[token]
+
+    def _month_columns(self) -> Tuple[list, list]:
+        """헤더 행(구분, 1월, 2월, ... 형태)에서 월 이름과 컬럼 위치 추출"""
+        header_row = self._find_anchor("구분")
+        if header_row is None:
+            return [], []
+
+        header = self.analysis_data.iloc[header_row, 2:]
+        month_mask = header.notna() & header.astype(str).str.contains("월", regex=False)
+        months = header[month_mask].astype(str).tolist()
+        month_indices = (np.flatnonzero(month_mask.to_numpy()) + 2).tolist()
+        return months, month_indices
+
+    def _build_monthly_data(self, months: list, month_indices: list) -> Dict:
+        """검사 Ch수 / 불량 건수 / CH당 불량률 행에서 월별 값 추출"""
+
+        def row_values(label: str) -> np.ndarray:
+            # 라벨 행이 없으면 0으로 채움
+            label_row = self._find_anchor(label)
+            if label_row is None:
+                return np.zeros(len(month_indices))
+            values = pd.to_numeric(self.analysis_data.iloc[label_row, month_indices])
+            return np.nan_to_num(values.to_numpy(dtype=float))
+
+        return {
+            "months": months,
+            "ch_counts": row_values("검사 Ch수").astype(int).tolist(),
+            "defect_counts": row_values("불량 건수").astype(int).tolist(),
+            # 소수점 형태를 백분율로 변환 (0.318 -> 31.8)
+            "defect_rates": (row_values("CH당 불량률") * 100).tolist(),
+        }
+
+    def _build_supplier_monthly_data(self, month_indices: list) -> Dict:
+        """기구 외주사별 불량률 섹션에서 외주사별 월별 불량률(%) 추출"""
+        suppliers_monthly = {}
+
+        # 기구 외주사별 불량률 섹션 찾기
+        supplier_section_start = self._find_anchor("기구 외주사별 불량률")
+        if supplier_section_start is None:
+            return suppliers_monthly
+
+        idx = supplier_section_start + 1
+        while idx < len(self.analysis_data):
+            row = self.analysis_data.iloc[idx]
+
+            # 두 번째 컬럼이 비어있으면 종료
+            if pd.isna(row.iloc[1]):
+                break
+
+            supplier_name = str(row.iloc[1]).strip()
+
+            # 외주사 이름이 유효한지 확인 (BAT, FNI, TMS 등)
+            if supplier_name and len(supplier_name) <= 5 and supplier_name.isalpha():
+                # 다음 행에서 월별 비율 데이터 추출
+                if idx + 1 < len(self.analysis_data):
+                    rate_row = self.analysis_data.iloc[idx + 1]
+                    # 월 컬럼을 한 번에 숫자로 변환 (숫자가 아닌 값은 0, 백분율로 변환)
+                    monthly_rates = (
+                        pd.to_numeric(
+                            rate_row.iloc[month_indices], errors="coerce"
+                        ).fillna(0)
+                        * 100
+                    )
 
-            # 동적으로 월별 데이터 추출
-            months = []
-            ch_counts = []
-            defect_counts = []
-            defect_rates = []
+                    suppliers_monthly[supplier_name] = monthly_rates.tolist()
 
-            # 헤더 행 찾기 (구분, 1월, 2월, ... 형태)
-            header_row = None
-            for idx, row in self.analysis_data.iterrows():
-                if pd.notna(row.iloc[1]) and "구분" in str(row.iloc[1]):
-                    header_row = idx
-                    break
+                # 다음 외주사로 이동 (비율 행 건너뛰기)
+                idx += 2
+            else:
+                idx += 1
 
-            if header_row is not None:
-                # 월별 컬럼 찾기 (1월, 2월, ... 형태)
-                month_indices = []
-                for col_idx in range(2, len(self.analysis_data.columns)):
-                    cell_value = self.analysis_data.iloc[header_row, col_idx]
-                    if pd.notna(cell_value) and "월" in str(cell_value):
-                        months.append(str(cell_value))
-                        month_indices.append(col_idx)
+        return suppliers_monthly
 
-                # 각 월별 데이터 추출
-                for month_idx in month_indices:
-                    # 검사 CH수 찾기
-                    ch_count = 0
-                    for idx, row in self.analysis_data.iterrows():
-                        if pd.notna(row.iloc[1]) and "검사 Ch수" in str(row.iloc[1]):
-                            ch_count = (
-                                row.iloc[month_idx]
-                                if pd.notna(row.iloc[month_idx])
-                                else 0
-                            )
-                            break
-                    ch_counts.append(int(ch_count) if ch_count != 0 else 0)
+    def _extract_all(self) -> Dict:
+        """월별 현황과 외주사별 월별 데이터를 한 번에 추출
 
-                    # 불량 건수 찾기
-                    defect_count = 0
-                    for idx, row in self.analysis_data.iterrows():
-                        if pd.notna(row.iloc[1]) and "불량 건수" in str(row.iloc[1]):
-                            defect_count = (
-                                row.iloc[month_idx]
-                                if pd.notna(row.iloc[month_idx])
-                                else 0
-                            )
-                            break
-                    defect_counts.append(int(defect_count) if defect_count != 0 else 0)
+        헤더 행과 월 컬럼은 한 번만 찾고, 같은 불량분석 시트에 대해서는 결과를 재사용.
+        분기별 데이터는 요청 시 월별 결과에서 계산 (월 헤더 해석 실패가 월별 결과에 영향 없도록)
+        """
+        if self.analysis_data is None:
+            self.load_analysis_data()
+        if self._extract_source is self.analysis_data:
+            return self._extract_cache
 
-                    # CH당 불량률 찾기
-                    defect_rate = 0
-                    for idx, row in self.analysis_data.iterrows():
-                        if pd.notna(row.iloc[1]) and "CH당 불량률" in str(row.iloc[1]):
-                            defect_rate = (
-                                row.iloc[month_idx]
-                                if pd.notna(row.iloc[month_idx])
-                                else 0
-                            )
-                            break
-                    # 소수점 형태를 백분율로 변환 (0.318 -> 31.8)
-                    defect_rates.append(
-                        float(defect_rate) * 100 if defect_rate != 0 else 0
-                    )
+        months, month_indices = self._month_columns()
+        self._extract_cache = {
+            "monthly": self._build_monthly_data(months, month_indices),
+            "supplier_monthly": {
+                "months": months,
+                "suppliers_monthly": self._build_supplier_monthly_data(month_indices),
+            },
+        }
+        self._extract_source = self.analysis_data
+        return self._extract_cache
 
-            logger.info(f"📊 동적 월별 데이터 추출 완료: {len(months)}개월")
+    def extract_monthly_data(self) -> Dict:
+        """월별 불량 현황 데이터 추출 (동적)"""
+        try:
+            monthly_data = self._extract_all()["monthly"]
 
-            return {
-                "months": months,
-                "ch_counts": ch_counts,
-                "defect_counts": defect_counts,
-                "defect_rates": defect_rates,
-            }
+            logger.info(
+                f"📊 동적 월별 데이터 추출 완료: {len(monthly_data['months'])}개월"
+            )
+
+            return monthly_data
 
         except Exception as e:
             logger.error(f"❌ 월별 데이터 추출 실패: {e}")
@@ -238,12 +564,13 @@ class DefectVisualizer:
             action_types = []
             action_counts = []
 
+            # 셀별 건수 값 행렬 (0 이상 숫자만, 그 외 NaN)
+            count_values = self._count_block()
+            count_valid = ~np.isnan(count_values)
+            n_cols = len(self.analysis_data.columns)
+
             # "불량조치 유형별" 섹션 찾기 (두 번째 컬럼에서)
-            action_section_start = None
-            for idx, row in self.analysis_data.iterrows():
-                if pd.notna(row.iloc[1]) and "불량조치 유형별" in str(row.iloc[1]):
-                    action_section_start = idx
-                    break
+            action_section_start = self._find_anchor("불량조치 유형별")
 
             if action_section_start is not None:
                 # 불량조치 유형별 데이터 추출 (다음 행부터 시작)
@@ -258,26 +585,14 @@ class DefectVisualizer:
 
                     # O열(누적값) 데이터 찾기 - 14번째 컬럼 (O열)
                     count = 0
-                    if len(self.analysis_data.columns) > 14:  # O열이 존재하는 경우
-                        cell_value = row.iloc[14]  # O열 (0-based index: 14)
-                        if (
-                            pd.notna(cell_value)
-                            and str(cell_value).replace(".", "").isdigit()
-                        ):
-                            count = int(float(cell_value))
+                    if n_cols > 14 and count_valid[idx, 14]:  # O열이 존재하는 경우
+                        count = int(count_values[idx, 14])
 
                     # O열에 데이터가 없으면 마지막 컬럼에서 역순으로 찾기
                     if count == 0:
-                        for col_idx in range(
-                            len(self.analysis_data.columns) - 1, 1, -1
-                        ):
-                            cell_value = row.iloc[col_idx]
-                            if (
-                                pd.notna(cell_value)
-                                and str(cell_value).replace(".", "").isdigit()
-                            ):
-                                count = int(float(cell_value))
-                                break
+                        numeric_cols = np.flatnonzero(count_valid[idx, 2:])
+                        if numeric_cols.size:
+                            count = int(count_values[idx, 2 + numeric_cols[-1]])
 
                     if action_type and count > 0:
                         action_types.append(action_type)
@@ -287,60 +602,41 @@ class DefectVisualizer:
             if not action_types:
                 logger.warning("⚠️ 첫 번째 시도 실패, 더 넓은 범위에서 재검색...")
 
-                # 전체 시트에서 "재체결", "재작업" 등의 키워드가 포함된 행 찾기
-                action_keywords = [
-                    "재체결",
-                    "재작업",
-                    "재조립",
-                    "Teflon",
-                    "파트교체",
-                    "교체",
-                    "체결",
-                    "클램프",
-                ]
-
-                for idx, row in self.analysis_data.iterrows():
-                    for col_idx in range(len(self.analysis_data.columns)):
-                        cell_value = (
-                            str(row.iloc[col_idx])
-                            if pd.notna(row.iloc[col_idx])
-                            else ""
-                        )
+                # 전체 시트에서 "재체결", "재작업" 등의 키워드가 포함된 셀 찾기
+                # (전체 셀을 한 번에 문자열로 펼쳐 정규식 하나로 판정)
+                cells = pd.Series(
+                    self.analysis_data.where(self.analysis_data.notna(), "")
+                    .astype(str)
+                    .to_numpy()
+                    .ravel()
+                )
+                stripped = cells.str.strip()
+                # 너무 긴 텍스트 제외
+                hit_mask = cells.str.contains(ACTION_KEYWORD_PATTERN) & (
+                    stripped.str.len() < 20
+                )
 
-                        # 조치 관련 키워드가 포함되어 있고, 숫자 데이터가 있는지 확인
-                        for keyword in action_keywords:
-                            if (
-                                keyword in cell_value and len(cell_value.strip()) < 20
-                            ):  # 너무 긴 텍스트 제외
-                                # O열(14번째 컬럼) 우선 확인
-                                count = 0
-                                if len(self.analysis_data.columns) > 14:
-                                    o_col_value = row.iloc[14]  # O열
-                                    if (
-                                        pd.notna(o_col_value)
-                                        and str(o_col_value).replace(".", "").isdigit()
-                                    ):
-                                        count = int(float(o_col_value))
+                # 키워드 셀별 건수: O열(14번째 컬럼) 우선, 없으면 같은 행 오른쪽 첫 숫자
+                hit_pos = np.flatnonzero(hit_mask.to_numpy())
+                hit_rows, hit_cols = np.divmod(hit_pos, n_cols)
+                hit_counts = np.zeros(len(hit_pos), dtype=int)
+                if n_cols > 14:
+                    o_valid = count_valid[hit_rows, 14]
+                    hit_counts[o_valid] = count_values[hit_rows[o_valid], 14]
+
+                after = count_valid[hit_rows] & (np.arange(n_cols) > hit_cols[:, None])
+                use_after = (hit_counts == 0) & after.any(axis=1)
+                hit_counts[use_after] = count_values[
+                    hit_rows[use_after], after.argmax(axis=1)[use_after]
+                ]
 
-                                # O열에 없으면 같은 행에서 숫자 찾기
-                                if count == 0:
-                                    for count_col in range(
-                                        col_idx + 1, len(self.analysis_data.columns)
-                                    ):
-                                        count_value = row.iloc[count_col]
-                                        if (
-                                            pd.notna(count_value)
-                                            and str(count_value)
-                                            .replace(".", "")
-                                            .isdigit()
-                                        ):
-                                            count = int(float(count_value))
-                                            break
-
-                                if count > 0 and cell_value.strip() not in action_types:
-                                    action_types.append(cell_value.strip())
-                                    action_counts.append(count)
-                                break
+                # 행 우선 순서로 처음 나온 조치 유형만 추가
+                for action_type, count in zip(
+                    stripped.to_numpy()[hit_pos], hit_counts.tolist()
+                ):
+                    if count > 0 and action_type not in action_types:
+                        action_types.append(action_type)
+                        action_counts.append(count)
 
                 # 여전히 데이터가 없으면 기본값 사용
                 if not action_types:
@@ -377,11 +673,7 @@ class DefectVisualizer:
             supplier_rates = []
 
             # "기구 외주사별 불량률" 섹션 찾기
-            supplier_section_start = None
-            for idx, row in self.analysis_data.iterrows():
-                if pd.notna(row.iloc[1]) and "기구 외주사별 불량률" in str(row.iloc[1]):
-                    supplier_section_start = idx
-                    break
+            supplier_section_start = self._find_anchor("기구 외주사별 불량률")
 
             if supplier_section_start is not None:
                 # 외주사별 데이터 추출 (다음 행부터 시작)
@@ -401,36 +693,24 @@ class DefectVisualizer:
                         and len(supplier_name) <= 5
                         and supplier_name.isalpha()
                     ):
-                        # 월별 데이터 합계 계산
-                        total_count = 0
-                        for col_idx in range(
-                            2, min(len(self.analysis_data.columns), 9)
-                        ):  # 1월~7월 데이터
-                            cell_value = row.iloc[col_idx]
-                            if (
-                                pd.notna(cell_value)
-                                and str(cell_value).replace(".", "").isdigit()
-                            ):
-                                total_count += int(float(cell_value))
+                        # 월별 데이터 합계 계산 (1월~7월, 0 이상의 숫자만 정수로 합산)
+                        counts = pd.to_numeric(row.iloc[2:9], errors="coerce")
+                        counts = counts[np.isfinite(counts) & (counts >= 0)]
+                        total_count = int(np.trunc(counts.to_numpy()).sum())
 
                         # 다음 행에서 비율 정보 추출
                         rate = 0
                         if idx + 1 < len(self.analysis_data):
                             rate_row = self.analysis_data.iloc[idx + 1]
-                            # 비율 행에서 평균 계산
-                            rate_values = []
-                            for col_idx in range(
-                                2, min(len(self.analysis_data.columns), 9)
-                            ):
-                                cell_value = rate_row.iloc[col_idx]
-                                if pd.notna(cell_value) and isinstance(
-                                    cell_value, (int, float)
-                                ):
-                                    rate_values.append(
-                                        float(cell_value) * 100
-                                    )  # 백분율로 변환
-                            if rate_values:
-                                rate = sum(rate_values) / len(rate_values)
+                            # 비율 행에서 평균 계산 (백분율로 변환)
+                            rate_values = (
+                                pd.to_numeric(rate_row.iloc[2:9], errors="coerce")
+                                .dropna()
+                                .to_numpy(dtype=float)
+                                * 100
+                            )
+                            if rate_values.size:
+                                rate = float(rate_values.sum() / rate_values.size)
 
                         if total_count > 0:
                             suppliers.append(supplier_name)
@@ -465,140 +745,78 @@ class DefectVisualizer:
     def extract_supplier_monthly_data(self) -> Dict:
         """기구 외주사별 월별 불량률 데이터 추출"""
         try:
-            if self.analysis_data is None:
-                self.load_analysis_data()
-
-            # 월별 컬럼 찾기
-            months = []
-            header_row = None
-            for idx, row in self.analysis_data.iterrows():
-                if pd.notna(row.iloc[1]) and "구분" in str(row.iloc[1]):
-                    header_row = idx
-                    break
-
-            month_indices = []
-            if header_row is not None:
-                for col_idx in range(2, len(self.analysis_data.columns)):
-                    cell_value = self.analysis_data.iloc[header_row, col_idx]
-                    if pd.notna(cell_value) and "월" in str(cell_value):
-                        months.append(str(cell_value))
-                        month_indices.append(col_idx)
-
-            # 기구 외주사별 불량률 섹션 찾기
-            supplier_section_start = None
-            for idx, row in self.analysis_data.iterrows():
-                if pd.notna(row.iloc[1]) and "기구 외주사별 불량률" in str(row.iloc[1]):
-                    supplier_section_start = idx
-                    break
-
-            suppliers_monthly = {}
-
-            if supplier_section_start is not None:
-                idx = supplier_section_start + 1
-                while idx < len(self.analysis_data):
-                    row = self.analysis_data.iloc[idx]
-
-                    # 두 번째 컬럼이 비어있으면 종료
-                    if pd.isna(row.iloc[1]):
-                        break
-
-                    supplier_name = str(row.iloc[1]).strip()
-
-                    # 외주사 이름이 유효한지 확인 (BAT, FNI, TMS 등)
-                    if (
-                        supplier_name
-                        and len(supplier_name) <= 5
-                        and supplier_name.isalpha()
-                    ):
-                        # 다음 행에서 월별 비율 데이터 추출
-                        if idx + 1 < len(self.analysis_data):
-                            rate_row = self.analysis_data.iloc[idx + 1]
-                            monthly_rates = []
-
-                            for month_idx in month_indices:
-                                cell_value = rate_row.iloc[month_idx]
-                                if pd.notna(cell_value) and isinstance(
-                                    cell_value, (int, float)
-                                ):
-                                    monthly_rates.append(
-                                        float(cell_value) * 100
-                                    )  # 백분율로 변환
-                                else:
-                                    monthly_rates.append(0)
-
-                            suppliers_monthly[supplier_name] = monthly_rates
-
-                        # 다음 외주사로 이동 (비율 행 건너뛰기)
-                        idx += 2
-                    else:
-                        idx += 1
+            monthly_data = self._extract_all()["supplier_monthly"]
 
             logger.info(
-                f"📊 외주사별 월별 데이터 추출 완료: {len(suppliers_monthly)}개 업체"
+                f"📊 외주사별 월별 데이터 추출 완료: {len(monthly_data['suppliers_monthly'])}개 업체"
             )
 
-            return {"months": months, "suppliers_monthly": suppliers_monthly}
+            return monthly_data
 
         except Exception as e:
             logger.error(f"❌ 외주사별 월별 데이터 추출 실패: {e}")
             flush_log(logger)
             raise
 
-    def extract_supplier_quarterly_data(self) -> Dict:
-        """기구 외주사별 분기별 불량률 데이터 추출"""
-        try:
-            # 월별 데이터를 분기별로 그룹화
-            monthly_data = self.extract_supplier_monthly_data()
+    def _group_months_by_quarter(
+        self, months: list, suppliers_monthly: Dict
+    ) -> Tuple[list, Dict]:
+        """월별 불량률을 분기별 평균으로 변환 (분기는 처음 등장한 순서 유지)"""
+        month_nums = np.array(
+            [int(month.replace("월", "")) for month in months], dtype=int
+        )
+        # 1~9월 외(10~12월 등)는 모두 4분기
+        quarter_idx = np.where(
+            (month_nums >= 1) & (month_nums <= 9), (month_nums - 1) // 3, 3
+        )
+        quarter_order = pd.unique(quarter_idx)
+        quarters = QUARTER_NAMES[quarter_order].tolist()
+
+        suppliers_quarterly = {}
+        for supplier, monthly_rates in suppliers_monthly.items():
+            rates = np.asarray(monthly_rates, dtype=float)
+            suppliers_quarterly[supplier] = [
+                round(float(rates[quarter_idx == q].mean()), 1) for q in quarter_order
+            ]
 
-            # 분기별 그룹화 (1-3월: 1분기, 4-6월: 2분기, 7-9월: 3분기, 10-12월: 4분기)
-            quarters = []
-            suppliers_quarterly = {}
+        return quarters, suppliers_quarterly
 
-            # 월별 데이터를 분기별로 변환
-            months = monthly_data["months"]
-            month_to_quarter = {}
+    def _period_month_names(self, periods) -> list:
+        """월(Period) 목록을 한국어 월 이름으로 변환 (2025년 외에는 기간 문자열 그대로)"""
+        if len(periods) == 0:
+            return []
+        periods = pd.PeriodIndex(periods)
+        return np.where(
+            periods.year == 2025, MONTH_NAMES[periods.month - 1], periods.astype(str)
+        ).tolist()
 
-            for month in months:
-                month_num = int(month.replace("월", ""))
-                if month_num in [1, 2, 3]:
-                    quarter = "1분기"
-                elif month_num in [4, 5, 6]:
-                    quarter = "2분기"
-                elif month_num in [7, 8, 9]:
-                    quarter = "3분기"
-                else:
-                    quarter = "4분기"
-
-                month_to_quarter[month] = quarter
-                if quarter not in quarters:
-                    quarters.append(quarter)
-
-            # 각 외주사별로 분기별 데이터 계산
-            for supplier, monthly_rates in monthly_data["suppliers_monthly"].items():
-                quarterly_rates = []
-
-                for quarter in quarters:
-                    # 해당 분기의 월별 데이터 평균 계산
-                    quarter_months = [
-                        i
-                        for i, month in enumerate(months)
-                        if month_to_quarter[month] == quarter
-                    ]
-                    if quarter_months:
-                        quarter_avg = sum(
-                            monthly_rates[i] for i in quarter_months
-                        ) / len(quarter_months)
-                        quarterly_rates.append(round(quarter_avg, 1))
-                    else:
-                        quarterly_rates.append(0)
+    def _period_quarter_names(self, periods) -> list:
+        """분기(Period) 목록을 한국어 분기 이름으로 변환"""
+        if len(periods) == 0:
+            return []
+        return QUARTER_NAMES[pd.PeriodIndex(periods).quarter - 1].tolist()
 
-                suppliers_quarterly[supplier] = quarterly_rates
+    def extract_supplier_quarterly_data(self) -> Dict:
+        """기구 외주사별 분기별 불량률 데이터 추출"""
+        try:
+            extracted = self._extract_all()
+            if "supplier_quarterly" not in extracted:
+                supplier_monthly = extracted["supplier_monthly"]
+                # 분기별 그룹화 (1-3월: 1분기, 4-6월: 2분기, 7-9월: 3분기, 10-12월: 4분기)
+                quarters, suppliers_quarterly = self._group_months_by_quarter(
+                    supplier_monthly["months"], supplier_monthly["suppliers_monthly"]
+                )
+                extracted["supplier_quarterly"] = {
+                    "quarters": quarters,
+                    "suppliers_quarterly": suppliers_quarterly,
+                }
+            quarterly_data = extracted["supplier_quarterly"]
 
             logger.info(
-                f"📊 외주사별 분기별 데이터 추출 완료: {len(suppliers_quarterly)}개 업체, {len(quarters)}개 분기"
+                f"📊 외주사별 분기별 데이터 추출 완료: {len(quarterly_data['suppliers_quarterly'])}개 업체, {len(quarterly_data['quarters'])}개 분기"
             )
 
-            return {"quarters": quarters, "suppliers_quarterly": suppliers_quarterly}
+            return quarterly_data
 
         except Exception as e:
             logger.error(f"❌ 외주사별 분기별 데이터 추출 실패: {e}")
@@ -607,6 +825,9 @@ class DefectVisualizer:
 
     def create_monthly_trend_chart(self) -> go.Figure:
         """월별 불량 트렌드 차트 생성"""
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+
         try:
             monthly_data = self.extract_monthly_data()
 
@@ -674,11 +895,9 @@ class DefectVisualizer:
                     "font": {"size": 20, "family": "Arial, sans-serif"},
                 },
                 xaxis=dict(tickangle=0, tickfont=dict(size=12)),
-                legend=dict(
-                    orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1
-                ),
+                legend=TOP_RIGHT_LEGEND,
                 height=500,
-                template="plotly_white",
+                template=_chart_template(),
             )
 
             return fig
@@ -690,6 +909,8 @@ class DefectVisualizer:
 
     def create_action_type_integrated_chart_OLD_DISABLED(self) -> go.Figure:
         """불량조치 유형별 통합 차트 (불량내역 기반, 드롭다운 메뉴 포함)"""
+        import plotly.graph_objects as go
+
         try:
             logger.info("📊 가압검사 조치유형별 통합 차트 생성 (불량내역 기반)")
 
@@ -697,17 +918,15 @@ class DefectVisualizer:
             if self.defect_data is None:
                 self.load_defect_data()
 
-            df = self.defect_data.copy()
-            df["발생일_pd"] = pd.to_datetime(df["발생일"], errors="coerce")
-            df["발생월"] = df["발생일_pd"].dt.to_period("M")
-            df["발생분기"] = df["발생일_pd"].dt.to_period("Q")
+            # 발생일을 날짜로 변환하고 월/분기 컬럼 추가 (원본 데이터는 복사하지 않음)
+            df = self._with_period_columns(self.defect_data)
 
             # 유효한 데이터만 필터링
-            df_valid = df.dropna(subset=["상세조치내용", "발생일_pd"])
+            df_valid = self._valid_action_rows(df)
             logger.info(f"📊 유효한 불량내역 데이터: {len(df_valid)}건")
 
             # 1. 전체분포용 데이터 (상세조치내용 카운트)
-            action_counts = df_valid["상세조치내용"].value_counts()
+            action_counts = self._value_counts(df_valid["상세조치내용"])
             logger.info(f"📊 조치유형별 카운트: {dict(action_counts.head())}")
 
             # 2. TOP3 조치유형 추출
@@ -750,70 +969,22 @@ class DefectVisualizer:
             )
 
             # 월별 조치 유형별 집계
-            monthly_action = (
-                df_filtered.groupby(["발생월", "상세조치내용"])
-                .size()
-                .unstack(fill_value=0)
-            )
+            monthly_action = self._count_table(df_filtered, "발생월", "상세조치내용")
 
             # 월 이름을 한국어로 변환
-            month_names = []
-            for month in monthly_action.index:
-                month_str = str(month)
-                if "2025-01" in month_str:
-                    month_names.append("1월")
-                elif "2025-02" in month_str:
-                    month_names.append("2월")
-                elif "2025-03" in month_str:
-                    month_names.append("3월")
-                elif "2025-04" in month_str:
-                    month_names.append("4월")
-                elif "2025-05" in month_str:
-                    month_names.append("5월")
-                elif "2025-06" in month_str:
-                    month_names.append("6월")
-                elif "2025-07" in month_str:
-                    month_names.append("7월")
-                elif "2025-08" in month_str:
-                    month_names.append("8월")
-                elif "2025-09" in month_str:
-                    month_names.append("9월")
-                elif "2025-10" in month_str:
-                    month_names.append("10월")
-                elif "2025-11" in month_str:
-                    month_names.append("11월")
-                elif "2025-12" in month_str:
-                    month_names.append("12월")
-                else:
-                    month_names.append(month_str)
+            month_names = self._period_month_names(monthly_action.index)
 
             # 3. 분기별 데이터 추가
-            df["발생분기"] = df["발생일_pd"].dt.to_period("Q")
             df_filtered_quarterly = df[df["상세조치내용"].isin(top_actions)]
             df_filtered_quarterly = df_filtered_quarterly.dropna(subset=["발생분기"])
 
             # 분기별 조치 유형별 집계
-            quarterly_action = (
-                df_filtered_quarterly.groupby(["발생분기", "상세조치내용"])
-                .size()
-                .unstack(fill_value=0)
+            quarterly_action = self._count_table(
+                df_filtered_quarterly, "발생분기", "상세조치내용"
             )
 
             # 분기 이름을 한국어로 변환 (동적으로 처리)
-            quarter_names = []
-            for quarter in quarterly_action.index:
-                quarter_str = str(quarter)
-                # Q1, Q2, Q3, Q4를 감지하여 변환
-                if "Q1" in quarter_str:
-                    quarter_names.append("1분기")
-                elif "Q2" in quarter_str:
-                    quarter_names.append("2분기")
-                elif "Q3" in quarter_str:
-                    quarter_names.append("3분기")
-                elif "Q4" in quarter_str:
-                    quarter_names.append("4분기")
-                else:
-                    quarter_names.append(quarter_str)
+            quarter_names = self._period_quarter_names(quarterly_action.index)
 
             # 메인 차트 생성
             fig = go.Figure()
@@ -841,6 +1012,7 @@ class DefectVisualizer:
             )
 
             # 2. 월별 TOP3 라인차트 (숨김)
+            month_top_parts = self._top_parts_by_period(df_filtered, "발생월")
             for i, action in enumerate(top_actions):
                 if action in monthly_action.columns:
                     # 해당 조치 유형의 부품별 정보 수집
@@ -850,14 +1022,8 @@ class DefectVisualizer:
                         month_count = monthly_action.loc[month, action]
 
                         if month_count > 0:
-                            # 해당 월, 해당 조치 유형의 부품들 추출
-                            month_action_df = df_filtered[
-                                (df_filtered["발생월"] == month)
-                                & (df_filtered["상세조치내용"] == action)
-                            ]
-
-                            # 부품별 건수 집계
-                            part_counts = month_action_df["부품명"].value_counts()
+                            # 해당 월, 해당 조치 유형의 주요 부품 (미리 집계한 결과 조회)
+                            part_counts = month_top_parts.get((month, action), [])
 
                             # hover text 생성
                             hover_text = f"<b>{month_name}: {action}</b><br>"
@@ -865,9 +1031,7 @@ class DefectVisualizer:
 
                             if len(part_counts) > 0:
                                 hover_text += "<b>주요 부품:</b><br>"
-                                for k, (part, count) in enumerate(
-                                    part_counts.head(5).items(), 1
-                                ):
+                                for k, (part, count) in enumerate(part_counts, 1):
                                     hover_text += f"{k}. {part}: {count}건<br>"
 
                             action_parts_info.append(hover_text)
@@ -901,6 +1065,9 @@ class DefectVisualizer:
                     )
 
             # 3. 분기별 TOP3 막대차트 (숨김)
+            quarter_top_parts = self._top_parts_by_period(
+                df_filtered_quarterly, "발생분기"
+            )
             for i, action in enumerate(top_actions):
                 if action in quarterly_action.columns:
                     # 해당 조치 유형의 부품별 정보 수집
@@ -910,14 +1077,8 @@ class DefectVisualizer:
                         quarter_count = quarterly_action.loc[quarter, action]
 
                         if quarter_count > 0:
-                            # 해당 분기, 해당 조치 유형의 부품들 추출
-                            quarter_action_df = df_filtered_quarterly[
-                                (df_filtered_quarterly["발생분기"] == quarter)
-                                & (df_filtered_quarterly["상세조치내용"] == action)
-                            ]
-
-                            # 부품별 건수 집계
-                            part_counts = quarter_action_df["부품명"].value_counts()
+                            # 해당 분기, 해당 조치 유형의 주요 부품 (미리 집계한 결과 조회)
+                            part_counts = quarter_top_parts.get((quarter, action), [])
 
                             # hover text 생성
                             hover_text = f"<b>{quarter_name}: {action}</b><br>"
@@ -925,9 +1086,7 @@ class DefectVisualizer:
 
                             if len(part_counts) > 0:
                                 hover_text += "<b>주요 부품:</b><br>"
-                                for k, (part, count) in enumerate(
-                                    part_counts.head(5).items(), 1
-                                ):
+                                for k, (part, count) in enumerate(part_counts, 1):
                                     hover_text += f"{k}. {part}: {count}건<br>"
 
                             action_parts_info.append(hover_text)
@@ -1047,7 +1206,7 @@ class DefectVisualizer:
                 },
                 height=500,
                 margin=dict(l=50, r=50, t=120, b=50),
-                template="plotly_white",
+                template=_chart_template(),
                 xaxis=dict(visible=False),
                 yaxis=dict(visible=False),
                 legend=dict(
@@ -1064,6 +1223,8 @@ class DefectVisualizer:
 
     def create_action_type_integrated_chart(self) -> go.Figure:
         """불량조치 유형별 통합 차트 (불량내역 기반, 드롭다운 메뉴 포함)"""
+        import plotly.graph_objects as go
+
         try:
             logger.info("📊 가압검사 조치유형별 통합 차트 생성 (불량내역 기반)")
 
@@ -1071,17 +1232,15 @@ class DefectVisualizer:
             if self.defect_data is None:
                 self.load_defect_data()
 
-            df = self.defect_data.copy()
-            df["발생일_pd"] = pd.to_datetime(df["발생일"], errors="coerce")
-            df["발생월"] = df["발생일_pd"].dt.to_period("M")
-            df["발생분기"] = df["발생일_pd"].dt.to_period("Q")
+            # 발생일을 날짜로 변환하고 월/분기 컬럼 추가 (원본 데이터는 복사하지 않음)
+            df = self._with_period_columns(self.defect_data)
 
             # 유효한 데이터만 필터링
-            df_valid = df.dropna(subset=["상세조치내용", "발생일_pd"])
+            df_valid = self._valid_action_rows(df)
             logger.info(f"📊 유효한 불량내역 데이터: {len(df_valid)}건")
 
             # 전체분포용 데이터 (상세조치내용 카운트)
-            action_counts = df_valid["상세조치내용"].value_counts()
+            action_counts = self._value_counts(df_valid["상세조치내용"])
             logger.info(f"📊 조치유형별 카운트: {dict(action_counts.head())}")
 
             # TOP3 조치유형 추출
@@ -1124,11 +1283,7 @@ class DefectVisualizer:
             )
 
             # 2. 분기별 비교 (TOP3) - 막대 차트
-            quarterly_data = (
-                df_top3.groupby(["발생분기", "상세조치내용"])
-                .size()
-                .unstack(fill_value=0)
-            )
+            quarterly_data = self._count_table(df_top3, "발생분기", "상세조치내용")
 
             # 분기 이름을 한국어로 변환
             quarter_names = []
@@ -1142,21 +1297,18 @@ class DefectVisualizer:
                     quarter_names.append(quarter_str)
 
             # 분기별 비교용 막대 차트 추가
+            quarter_top_parts = self._top_parts_by_period(df_top3, "발생분기")
             for i, action in enumerate(top_actions):
                 if action in quarterly_data.columns:
                     # 각 분기+조치유형 조합의 주요 부품명 추출 (hover용)
                     hover_texts = []
                     for quarter_period in quarterly_data.index:
-                        quarter_data_filtered = df_top3[
-                            (df_top3["발생분기"] == quarter_period)
-                            & (df_top3["상세조치내용"] == action)
+                        top_parts = [
+                            part
+                            for part, _ in quarter_top_parts.get(
+                                (quarter_period, action), []
+                            )
                         ]
-                        top_parts = (
-                            quarter_data_filtered["부품명"]
-                            .value_counts()
-                            .head(5)
-                            .index.tolist()
-                        )
                         hover_text = (
                             f"주요부품: {', '.join(top_parts[:3])}"
                             if top_parts
@@ -1180,9 +1332,7 @@ class DefectVisualizer:
                     )
 
             # 3. 월별 추이 (TOP3) - 라인 차트
-            monthly_data = (
-                df_top3.groupby(["발생월", "상세조치내용"]).size().unstack(fill_value=0)
-            )
+            monthly_data = self._count_table(df_top3, "발생월", "상세조치내용")
 
             # 월 이름을 한국어로 변환
             month_names = []
@@ -1300,7 +1450,7 @@ class DefectVisualizer:
                 },
                 height=500,
                 margin=dict(l=50, r=50, t=120, b=50),
-                template="plotly_white",
+                template=_chart_template(),
                 xaxis=dict(visible=False, showgrid=False, zeroline=False),
                 yaxis=dict(visible=False, showgrid=False, zeroline=False),
                 legend=dict(
@@ -1318,6 +1468,8 @@ class DefectVisualizer:
 
     def create_supplier_chart(self) -> go.Figure:
         """외주사별 불량 차트 생성"""
+        import plotly.graph_objects as go
+
         try:
             supplier_data = self.extract_supplier_data()
 
@@ -1357,7 +1509,7 @@ class DefectVisualizer:
                 yaxis=dict(tickfont=dict(size=12), title_font=dict(size=14)),
                 height=450,
                 margin=dict(l=50, r=50, t=80, b=50),
-                template="plotly_white",
+                template=_chart_template(),
             )
 
             return fig
@@ -1369,6 +1521,8 @@ class DefectVisualizer:
 
     def create_supplier_monthly_chart(self) -> go.Figure:
         """기구 외주사별 월별 불량률 차트 생성"""
+        import plotly.graph_objects as go
+
         try:
             monthly_data = self.extract_supplier_monthly_data()
 
@@ -1423,12 +1577,10 @@ class DefectVisualizer:
                         * 1.1,
                     ],
                 ),
-                legend=dict(
-                    orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1
-                ),
+                legend=TOP_RIGHT_LEGEND,
                 height=450,
                 margin=dict(l=50, r=50, t=80, b=50),
-                template="plotly_white",
+                template=_chart_template(),
                 barmode="group",
             )
 
@@ -1441,6 +1593,8 @@ class DefectVisualizer:
 
     def create_supplier_quarterly_chart(self) -> go.Figure:
         """기구 외주사별 분기별 불량률 차트 생성"""
+        import plotly.graph_objects as go
+
         try:
             quarterly_data = self.extract_supplier_quarterly_data()
 
@@ -1500,12 +1654,10 @@ class DefectVisualizer:
                         * 1.1,
                     ],
                 ),
-                legend=dict(
-                    orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1
-                ),
+                legend=TOP_RIGHT_LEGEND,
                 height=450,
                 margin=dict(l=50, r=50, t=80, b=50),
-                template="plotly_white",
+                template=_chart_template(),
                 barmode="group",
             )
 
@@ -1518,6 +1670,8 @@ class DefectVisualizer:
 
     def create_supplier_integrated_chart(self) -> go.Figure:
         """기구 외주사별 통합 차트 (드롭다운 메뉴 포함)"""
+        import plotly.graph_objects as go
+
         try:
             # 1. 전체 현황 차트
             supplier_data = self.extract_supplier_data()
@@ -1700,12 +1854,10 @@ class DefectVisualizer:
                 yaxis_title="불량 건수",
                 xaxis=dict(tickfont=dict(size=12), title_font=dict(size=14)),
                 yaxis=dict(tickfont=dict(size=12), title_font=dict(size=14)),
-                legend=dict(
-                    orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1
-                ),
+                legend=TOP_RIGHT_LEGEND,
                 height=500,
                 margin=dict(l=50, r=50, t=120, b=50),
-                template="plotly_white",
+                template=_chart_template(),
                 barmode="group",
             )
 
@@ -1718,12 +1870,14 @@ class DefectVisualizer:
 
     def create_defect_category_chart(self) -> go.Figure:
         """불량 카테고리별 차트 생성 (불량내역 데이터 기반)"""
+        import plotly.graph_objects as go
+
         try:
             if self.defect_data is None:
                 self.load_defect_data()
 
             # 대분류별 불량 건수 집계
-            category_counts = self.defect_data["대분류"].value_counts()
+            category_counts = self._value_counts(self.defect_data["대분류"])
 
             # 상위 10개 카테고리만 표시
             top_categories = category_counts.head(10)
@@ -1751,7 +1905,7 @@ class DefectVisualizer:
                 yaxis_title="불량 건수",
                 xaxis=dict(tickangle=45),
                 height=400,
-                template="plotly_white",
+                template=_chart_template(),
             )
 
             return fig
@@ -1763,59 +1917,29 @@ class DefectVisualizer:
 
     def create_action_type_monthly_chart(self) -> go.Figure:
         """조치 유형별 TOP3 월별 시각화"""
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+
         try:
             if self.defect_data is None:
                 self.load_defect_data()
 
             # 데이터 전처리
-            df = self.defect_data.copy()
-            df["발생일_pd"] = pd.to_datetime(df["발생일"], errors="coerce")
-            df["발생월"] = df["발생일_pd"].dt.to_period("M")
+            # 발생일을 날짜로 변환하고 월/분기 컬럼 추가 (원본 데이터는 복사하지 않음)
+            df = self._with_period_columns(self.defect_data)
 
             # 조치 유형별 TOP3 추출
-            top_actions = df["상세조치내용"].value_counts().head(3).index.tolist()
+            top_actions = self._value_counts(df["상세조치내용"]).head(3).index.tolist()
 
             # 월별 데이터 필터링
             df_filtered = df[df["상세조치내용"].isin(top_actions)]
             df_filtered = df_filtered.dropna(subset=["발생월"])
 
             # 월별 조치 유형별 집계
-            monthly_action = (
-                df_filtered.groupby(["발생월", "상세조치내용"])
-                .size()
-                .unstack(fill_value=0)
-            )
+            monthly_action = self._count_table(df_filtered, "발생월", "상세조치내용")
 
             # 월 이름을 한국어로 변환
-            month_names = []
-            for month in monthly_action.index:
-                month_str = str(month)
-                if "2025-01" in month_str:
-                    month_names.append("1월")
-                elif "2025-02" in month_str:
-                    month_names.append("2월")
-                elif "2025-03" in month_str:
-                    month_names.append("3월")
-                elif "2025-04" in month_str:
-                    month_names.append("4월")
-                elif "2025-05" in month_str:
-                    month_names.append("5월")
-                elif "2025-06" in month_str:
-                    month_names.append("6월")
-                elif "2025-07" in month_str:
-                    month_names.append("7월")
-                elif "2025-08" in month_str:
-                    month_names.append("8월")
-                elif "2025-09" in month_str:
-                    month_names.append("9월")
-                elif "2025-10" in month_str:
-                    month_names.append("10월")
-                elif "2025-11" in month_str:
-                    month_names.append("11월")
-                elif "2025-12" in month_str:
-                    month_names.append("12월")
-                else:
-                    month_names.append(month_str)
+            month_names = self._period_month_names(monthly_action.index)
 
             # subplot을 사용하여 왼쪽에 배치
             from plotly.subplots import make_subplots
@@ -1835,6 +1959,7 @@ class DefectVisualizer:
             colors = ["#FF6B6B", "#4ECDC4", "#45B7D1"]
 
             # 첫 번째 컬럼에 막대 차트 추가 (왼쪽 정렬)
+            month_top_parts = self._top_parts_by_period(df_filtered, "발생월")
             for i, action in enumerate(top_actions):
                 if action in monthly_action.columns:
                     # 해당 조치 유형의 부품별 정보 수집
@@ -1844,14 +1969,8 @@ class DefectVisualizer:
                         month_count = monthly_action.loc[month, action]
 
                         if month_count > 0:
-                            # 해당 월, 해당 조치 유형의 부품들 추출
-                            month_action_df = df_filtered[
-                                (df_filtered["발생월"] == month)
-                                & (df_filtered["상세조치내용"] == action)
-                            ]
-
-                            # 부품별 건수 집계
-                            part_counts = month_action_df["부품명"].value_counts()
+                            # 해당 월, 해당 조치 유형의 주요 부품 (미리 집계한 결과 조회)
+                            part_counts = month_top_parts.get((month, action), [])
 
                             # hover text 생성
                             hover_text = f"<b>{month_name}: {action}</b><br>"
@@ -1859,9 +1978,7 @@ class DefectVisualizer:
 
                             if len(part_counts) > 0:
                                 hover_text += "<b>주요 부품:</b><br>"
-                                for k, (part, count) in enumerate(
-                                    part_counts.head(5).items(), 1
-                                ):
+                                for k, (part, count) in enumerate(part_counts, 1):
                                     hover_text += f"{k}. {part}: {count}건<br>"
 
                             action_parts_info.append(hover_text)
@@ -1889,7 +2006,7 @@ class DefectVisualizer:
 
             # 두 번째 컬럼에는 범례 정보를 텍스트로 표시
             legend_text = []
-            total_counts = df["상세조치내용"].value_counts()
+            total_counts = self._value_counts(df["상세조치내용"])
             for i, action in enumerate(top_actions):
                 count = total_counts[action] if action in total_counts else 0
                 legend_text.append(
@@ -1948,7 +2065,7 @@ class DefectVisualizer:
             fig.update_layout(
                 height=450,
                 margin=dict(l=10, r=10, t=80, b=50),
-                template="plotly_white",
+                template=_chart_template(),
                 barmode="group",
             )
 
@@ -1961,15 +2078,15 @@ class DefectVisualizer:
 
     def create_part_monthly_chart(self) -> go.Figure:
         """드롭다운 형태 부품 분석 차트"""
+        import plotly.graph_objects as go
+
         try:
             if self.defect_data is None:
                 self.load_defect_data()
 
             # 데이터 전처리 - He미보증 제외
-            df = self.defect_data.copy()
-            df["발생일_pd"] = pd.to_datetime(df["발생일"], errors="coerce")
-            df["발생월"] = df["발생일_pd"].dt.to_period("M")
-            df["발생분기"] = df["발생일_pd"].dt.to_period("Q")
+            # 발생일을 날짜로 변환하고 월/분기 컬럼 추가 (원본 데이터는 복사하지 않음)
+            df = self._with_period_columns(self.defect_data)
 
             # He미보증 데이터 제외
             df_filtered_he = df[
@@ -1983,12 +2100,12 @@ class DefectVisualizer:
 
             for quarter in quarters:
                 quarter_df = df_filtered_he[df_filtered_he["발생분기"] == quarter]
-                quarter_top5 = quarter_df["부품명"].value_counts().head(5)
+                quarter_top5 = self._value_counts(quarter_df["부품명"]).head(5)
                 quarterly_top5_data[quarter] = quarter_top5
 
             # 전체 기간 TOP3 부품의 월별 추이
             overall_top3_parts = (
-                df_filtered_he["부품명"].value_counts().head(3).index.tolist()
+                self._value_counts(df_filtered_he["부품명"]).head(3).index.tolist()
             )
 
             # 월별 데이터 추출
@@ -1997,55 +2114,14 @@ class DefectVisualizer:
 
             for month in months:
                 month_df = df_filtered_he[df_filtered_he["발생월"] == month]
-                month_part_counts = month_df["부품명"].value_counts()
+                month_part_counts = self._value_counts(month_df["부품명"])
                 monthly_top3_data[month] = month_part_counts
 
             # 분기 이름을 한국어로 동적 변환
-            quarter_names = []
-            for quarter in quarters:
-                quarter_str = str(quarter)
-                # 년도와 분기를 동적으로 추출
-                if "Q1" in quarter_str:
-                    quarter_names.append("1분기")
-                elif "Q2" in quarter_str:
-                    quarter_names.append("2분기")
-                elif "Q3" in quarter_str:
-                    quarter_names.append("3분기")
-                elif "Q4" in quarter_str:
-                    quarter_names.append("4분기")
-                else:
-                    quarter_names.append(quarter_str)
+            quarter_names = self._period_quarter_names(quarters)
 
             # 월 이름을 한국어로 변환
-            month_names = []
-            for month in months:
-                month_str = str(month)
-                if "2025-01" in month_str:
-                    month_names.append("1월")
-                elif "2025-02" in month_str:
-                    month_names.append("2월")
-                elif "2025-03" in month_str:
-                    month_names.append("3월")
-                elif "2025-04" in month_str:
-                    month_names.append("4월")
-                elif "2025-05" in month_str:
-                    month_names.append("5월")
-                elif "2025-06" in month_str:
-                    month_names.append("6월")
-                elif "2025-07" in month_str:
-                    month_names.append("7월")
-                elif "2025-08" in month_str:
-                    month_names.append("8월")
-                elif "2025-09" in month_str:
-                    month_names.append("9월")
-                elif "2025-10" in month_str:
-                    month_names.append("10월")
-                elif "2025-11" in month_str:
-                    month_names.append("11월")
-                elif "2025-12" in month_str:
-                    month_names.append("12월")
-                else:
-                    month_names.append(month_str)
+            month_names = self._period_month_names(months)
 
             # 차트 생성
             fig = go.Figure()
@@ -2054,7 +2130,7 @@ class DefectVisualizer:
             colors = ["#FF6B6B", "#4ECDC4", "#45B7D1", "#96CEB4", "#FFEAA7"]
 
             # 0. 전체 분포 파이차트 (TOP10 + 기타)
-            part_counts = df_filtered_he["부품명"].value_counts()
+            part_counts = self._value_counts(df_filtered_he["부품명"])
 
             # TOP10 추출
             top10_parts = part_counts.head(10)
@@ -2305,7 +2381,7 @@ class DefectVisualizer:
                 yaxis=dict(visible=False, showgrid=False, zeroline=False),
                 height=500,
                 margin=dict(l=50, r=50, t=100, b=50),
-                template="plotly_white",
+                template=_chart_template(),
                 updatemenus=[
                     dict(
                         buttons=dropdown_buttons,
@@ -3060,8 +3136,7 @@ class DefectVisualizer:
             file_content = self.teams_loader._download_excel_file(excel_file)
 
             # 제조품질 불량분석 워크시트 로드
-            excel_buffer = io.BytesIO(file_content)
-            df = pd.read_excel(excel_buffer, sheet_name="제조품질 불량분석")
+            df = self._read_excel_sheet(file_content, "제조품질 불량분석")
 
             logger.info(f"✅ 제조품질 불량분석 데이터 로드 완료: {df.shape}")
             flush_log(logger)
@@ -3090,7 +3165,7 @@ class DefectVisualizer:
                     "대분류": ["전장작업불량", "기구작업불량", "검사품질불량"] * 15,
                     "중분류": ["배선불량", "조립불량", "식별불량"] * 15,
                 }
-                df = pd.DataFrame(mock_data)
+                df = self._categorize_defect_columns(pd.DataFrame(mock_data))
                 logger.info(f"✅ Mock 제조품질 불량내역 데이터 로드 완료: {df.shape}")
                 flush_log(logger)
                 return df
@@ -3103,8 +3178,7 @@ class DefectVisualizer:
             file_content = self.teams_loader._download_excel_file(excel_file)
 
             # 제조품질 불량내역 워크시트 로드
-            excel_buffer = io.BytesIO(file_content)
-            df = pd.read_excel(excel_buffer, sheet_name="제조품질 불량내역")
+            df = self._read_excel_sheet(file_content, "제조품질 불량내역")
 
             # 컬럼명 확인 및 O열(불량위치), P열(상세조치내용) 컬럼명 설정
             if df.shape[1] >= 16:  # P열까지 있는지 확인 (P는 16번째 컬럼)
@@ -3115,6 +3189,9 @@ class DefectVisualizer:
                 if df.shape[1] > 15:
                     df.columns.values[15] = "상세조치내용"
 
+            # 반복 문자열 컬럼을 category로 변환 (불량내역과 동일)
+            df = self._categorize_defect_columns(df)
+
             logger.info(f"✅ 제조품질 불량내역 데이터 로드 완료: {df.shape}")
             logger.info(f"📊 컬럼명들: {list(df.columns)}")
             flush_log(logger)
@@ -3427,48 +3504,9 @@ class DefectVisualizer:
             monthly_data = self.extract_quality_supplier_monthly_data()
 
             # 분기별 그룹화 (1-3월: 1분기, 4-6월: 2분기, 7-9월: 3분기, 10-12월: 4분기)
-            quarters = []
-            suppliers_quarterly = {}
-
-            # 월별 데이터를 분기별로 변환
-            months = monthly_data["months"]
-            month_to_quarter = {}
-
-            for month in months:
-                month_num = int(month.replace("월", ""))
-                if month_num in [1, 2, 3]:
-                    quarter = "1분기"
-                elif month_num in [4, 5, 6]:
-                    quarter = "2분기"
-                elif month_num in [7, 8, 9]:
-                    quarter = "3분기"
-                else:
-                    quarter = "4분기"
-
-                month_to_quarter[month] = quarter
-                if quarter not in quarters:
-                    quarters.append(quarter)
-
-            # 각 외주사별로 분기별 데이터 계산
-            for supplier, monthly_rates in monthly_data["suppliers_monthly"].items():
-                quarterly_rates = []
-
-                for quarter in quarters:
-                    # 해당 분기의 월별 데이터 평균 계산
-                    quarter_months = [
-                        i
-                        for i, month in enumerate(months)
-                        if month_to_quarter[month] == quarter
-                    ]
-                    if quarter_months:
-                        quarter_avg = sum(
-                            monthly_rates[i] for i in quarter_months
-                        ) / len(quarter_months)
-                        quarterly_rates.append(round(quarter_avg, 1))
-                    else:
-                        quarterly_rates.append(0)
-
-                suppliers_quarterly[supplier] = quarterly_rates
+            quarters, suppliers_quarterly = self._group_months_by_quarter(
+                monthly_data["months"], monthly_data["suppliers_monthly"]
+            )
 
             logger.info(
                 f"📊 제조품질 외주사별 분기별 데이터 추출 완료: {len(suppliers_quarterly)}개 업체, {len(quarters)}개 분기"
@@ -3483,6 +3521,9 @@ class DefectVisualizer:
 
     def create_quality_monthly_trend_chart(self) -> go.Figure:
         """제조품질 월별 트렌드 차트 생성 (가압검사와 완전히 동일한 구조)"""
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+
         try:
             logger.info("📊 제조품질 월별 트렌드 차트 생성 중...")
 
@@ -3552,11 +3593,9 @@ class DefectVisualizer:
                     "font": {"size": 20, "family": "Arial, sans-serif"},
                 },
                 xaxis=dict(tickangle=0, tickfont=dict(size=12)),
-                legend=dict(
-                    orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1
-                ),
+                legend=TOP_RIGHT_LEGEND,
                 height=500,
-                template="plotly_white",
+                template=_chart_template(),
             )
 
             logger.info("✅ 제조품질 월별 트렌드 차트 생성 완료")
@@ -3571,6 +3610,8 @@ class DefectVisualizer:
 
     def create_quality_action_integrated_chart(self) -> go.Figure:
         """제조품질 조치 유형별 통합 차트 생성 (불량내역 기반, 가압검사와 동일한 방식)"""
+        import plotly.graph_objects as go
+
         try:
             logger.info("📊 제조품질 조치유형별 통합 차트 생성 (불량내역 기반)")
 
@@ -3581,17 +3622,15 @@ class DefectVisualizer:
             ):
                 self.quality_defect_data = self.load_quality_defect_data()
 
-            df = self.quality_defect_data.copy()
-            df["발생일_pd"] = pd.to_datetime(df["발생일"], errors="coerce")
-            df["발생월"] = df["발생일_pd"].dt.to_period("M")
-            df["발생분기"] = df["발생일_pd"].dt.to_period("Q")
+            # 발생일을 날짜로 변환하고 월/분기 컬럼 추가 (원본 데이터는 복사하지 않음)
+            df = self._with_period_columns(self.quality_defect_data)
 
             # 유효한 데이터만 필터링
-            df_valid = df.dropna(subset=["상세조치내용", "발생일_pd"])
+            df_valid = self._valid_action_rows(df)
             logger.info(f"📊 제조품질 유효한 불량내역 데이터: {len(df_valid)}건")
 
             # 전체분포용 데이터 (상세조치내용 카운트)
-            action_counts = df_valid["상세조치내용"].value_counts()
+            action_counts = self._value_counts(df_valid["상세조치내용"])
             logger.info(f"📊 제조품질 조치유형별 카운트: {dict(action_counts.head())}")
 
             # TOP3 조치유형 추출
@@ -3634,11 +3673,7 @@ class DefectVisualizer:
             )
 
             # 2. 분기별 비교 (TOP3) - 막대 차트
-            quarterly_data = (
-                df_top3.groupby(["발생분기", "상세조치내용"])
-                .size()
-                .unstack(fill_value=0)
-            )
+            quarterly_data = self._count_table(df_top3, "발생분기", "상세조치내용")
 
             # 분기 이름을 한국어로 변환
             quarter_names = []
@@ -3652,21 +3687,18 @@ class DefectVisualizer:
                     quarter_names.append(quarter_str)
 
             # 분기별 비교용 막대 차트 추가
+            quarter_top_parts = self._top_parts_by_period(df_top3, "발생분기")
             for i, action in enumerate(top_actions):
                 if action in quarterly_data.columns:
                     # 각 분기+조치유형 조합의 주요 부품명 추출 (hover용)
                     hover_texts = []
                     for quarter_period in quarterly_data.index:
-                        quarter_data_filtered = df_top3[
-                            (df_top3["발생분기"] == quarter_period)
-                            & (df_top3["상세조치내용"] == action)
+                        top_parts = [
+                            part
+                            for part, _ in quarter_top_parts.get(
+                                (quarter_period, action), []
+                            )
                         ]
-                        top_parts = (
-                            quarter_data_filtered["부품명"]
-                            .value_counts()
-                            .head(5)
-                            .index.tolist()
-                        )
                         hover_text = (
                             f"주요부품: {', '.join(top_parts[:3])}"
                             if top_parts
@@ -3690,9 +3722,7 @@ class DefectVisualizer:
                     )
 
             # 3. 월별 추이 (TOP3) - 라인 차트
-            monthly_data = (
-                df_top3.groupby(["발생월", "상세조치내용"]).size().unstack(fill_value=0)
-            )
+            monthly_data = self._count_table(df_top3, "발생월", "상세조치내용")
 
             # 월 이름을 한국어로 변환
             month_names = []
@@ -3810,7 +3840,7 @@ class DefectVisualizer:
                 },
                 height=500,
                 margin=dict(l=50, r=50, t=120, b=50),
-                template="plotly_white",
+                template=_chart_template(),
                 xaxis=dict(visible=False, showgrid=False, zeroline=False),
                 yaxis=dict(visible=False, showgrid=False, zeroline=False),
                 legend=dict(
@@ -3828,6 +3858,8 @@ class DefectVisualizer:
 
     def create_quality_supplier_integrated_chart(self) -> go.Figure:
         """제조품질 외주사별 통합 차트 생성 (가압검사와 동일한 드롭다운 방식)"""
+        import plotly.graph_objects as go
+
         try:
             logger.info("📊 제조품질 외주사별 통합 차트 생성 중...")
 
@@ -4016,7 +4048,7 @@ class DefectVisualizer:
                 xaxis_title="외주사",
                 yaxis_title="불량 건수",
                 height=500,
-                template="plotly_white",
+                template=_chart_template(),
                 font=dict(family="Arial, sans-serif", size=12),
                 legend=dict(
                     orientation="v", yanchor="top", y=1, xanchor="left", x=1.02
@@ -4036,6 +4068,8 @@ class DefectVisualizer:
 
     def create_quality_part_monthly_chart(self) -> go.Figure:
         """제조품질 부품별 상세 분석 차트 생성 (가압검사와 완전히 동일한 구조)"""
+        import plotly.graph_objects as go
+
         try:
             logger.info("📊 제조품질 부품별 상세 분석 차트 생성 중...")
 
@@ -4045,12 +4079,8 @@ class DefectVisualizer:
             ):
                 self.quality_defect_data = self.load_quality_defect_data()
 
-            df = self.quality_defect_data.copy()
-
-            # 발생일을 날짜 형식으로 변환
-            df["발생일_pd"] = pd.to_datetime(df["발생일"], errors="coerce")
-            df["발생분기"] = df["발생일_pd"].dt.to_period("Q")
-            df["발생월"] = df["발생일_pd"].dt.to_period("M")
+            # 발생일을 날짜로 변환하고 월/분기 컬럼 추가 (원본 데이터는 복사하지 않음)
+            df = self._with_period_columns(self.quality_defect_data)
 
             # 각 분기별 상위 5개 부품 추출
             quarters = df["발생분기"].dropna().unique()
@@ -4058,20 +4088,18 @@ class DefectVisualizer:
 
             for quarter in quarters:
                 quarter_data = df[df["발생분기"] == quarter]
-                part_counts = quarter_data["부품명"].value_counts().head(5)
+                part_counts = self._value_counts(quarter_data["부품명"]).head(5)
                 quarterly_top5_data[quarter] = part_counts
 
             # 전체 기간 상위 3개 부품 (월별 추이용)
-            top3_parts = df["부품명"].value_counts().head(3).index.tolist()
+            top3_parts = self._value_counts(df["부품명"]).head(3).index.tolist()
 
             # 월별 데이터 필터링 (TOP3)
             df_top3 = df[df["부품명"].isin(top3_parts)]
             df_top3 = df_top3.dropna(subset=["발생월"])
 
             # 월별 부품별 집계
-            monthly_top3 = (
-                df_top3.groupby(["발생월", "부품명"]).size().unstack(fill_value=0)
-            )
+            monthly_top3 = self._count_table(df_top3, "발생월", "부품명")
             months = monthly_top3.index  # months 변수 추가
 
             # 월 이름을 한국어로 변환
@@ -4085,19 +4113,7 @@ class DefectVisualizer:
                     month_names.append(month_str)
 
             # 분기 이름을 한국어로 변환
-            quarter_names = []
-            for quarter in quarters:
-                quarter_str = str(quarter)
-                if "Q1" in quarter_str:
-                    quarter_names.append("1분기")
-                elif "Q2" in quarter_str:
-                    quarter_names.append("2분기")
-                elif "Q3" in quarter_str:
-                    quarter_names.append("3분기")
-                elif "Q4" in quarter_str:
-                    quarter_names.append("4분기")
-                else:
-                    quarter_names.append(quarter_str)
+            quarter_names = self._period_quarter_names(quarters)
 
             # 메인 차트 생성
             fig = go.Figure()
@@ -4106,7 +4122,7 @@ class DefectVisualizer:
             colors = ["#FF6B6B", "#4ECDC4", "#45B7D1", "#96CEB4", "#FFEAA7"]
 
             # 0. 전체 분포 파이차트 (TOP10 + 기타)
-            part_counts = df["부품명"].value_counts()
+            part_counts = self._value_counts(df["부품명"])
 
             # TOP10 추출
             top10_parts = part_counts.head(10)
@@ -4345,7 +4361,7 @@ class DefectVisualizer:
                 yaxis=dict(visible=False, showgrid=False, zeroline=False),
                 height=500,
                 margin=dict(l=50, r=50, t=100, b=50),
-                template="plotly_white",
+                template=_chart_template(),
                 updatemenus=[
                     dict(
                         buttons=dropdown_buttons,
@@ -77,6 +77,12 @@ class TeamsConfig:
     # API 스코프
     scopes: List[str] = None
 
+    # 로컬 캐시 (TTL 내에는 Teams 재다운로드 생략, 기본값 0 = 비활성화)
+    cache_dir: str = os.path.expanduser(
+        os.getenv("TEAMS_CACHE_DIR", os.path.join("~", ".cache", "pda_defect"))
+    )
+    cache_ttl_hours: float = float(os.getenv("TEAMS_CACHE_TTL_HOURS", "0"))
+
     def __post_init__(self):
         if self.worksheet_names is None:
             self.worksheet_names = [
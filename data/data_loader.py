@@ -1,6 +1,7 @@
+import re
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 from collections import Counter
 from googleapiclient.discovery import build
 from google.oauth2.service_account import Credentials
@@ -13,6 +14,10 @@ from utils.logger import setup_logger, flush_log
 
 logger = setup_logger(__name__)
 
+# 텍스트 전처리용 정규식 (모듈 로드 시 한 번만 컴파일)
+ENGLISH_WORD_PATTERN = re.compile(r'\b[A-Za-z][A-Za-z0-9\s]*\b')
+SPECIAL_CHAR_PATTERN = re.compile(r'[^\w\s가-힣]')
+
 
 class DataLoader:
     """데이터 로드 및 전처리 클래스"""
@@ -100,13 +105,12 @@ class DataLoader:
                 return []
             
             # 1. 영어 키워드 추출 (대소문자 구분 없이)
-            import re
-            english_words = re.findall(r'\b[A-Za-z][A-Za-z0-9\s]*\b', text)
+            english_words = ENGLISH_WORD_PATTERN.findall(text)
             english_words = [word.strip() for word in english_words if len(word.strip()) > 1]
             
             # 2. 한국어 명사 추출 (MeCab)
             # 특수문자 제거 후 한국어 추출
-            clean_text = re.sub(r'[^\w\s가-힣]', ' ', text)
+            clean_text = SPECIAL_CHAR_PATTERN.sub(' ', text)
             korean_nouns = self.mecab.nouns(clean_text)
             korean_nouns = [
                 noun for noun in korean_nouns 
@@ -122,6 +126,11 @@ class DataLoader:
             logger.warning(f"텍스트 전처리 실패: {text[:20]}... - {e}")
             return []
 
+    def preprocess_texts(self, texts: Iterable[str]) -> List[List[str]]:
+        """여러 텍스트를 일괄 전처리 (MeCab 인스턴스와 정규식을 재사용)"""
+        preprocess = self.preprocess_text
+        return [preprocess(text) for text in texts]
+
     def save_data_incremental(
         self, new_data: pd.DataFrame, save_path: str = None
     ) -> None:
@@ -290,17 +290,23 @@ class TeamsDataLoader:
             flush_log(logger)
             raise
 
-    def load_defect_data_from_teams(self) -> pd.DataFrame:
-        """Teams에서 불량 데이터 로드 (여러 워크시트 통합)"""
+    def load_defect_data_from_teams(
+        self, excel_file: Optional[Dict] = None
+    ) -> pd.DataFrame:
+        """Teams에서 불량 데이터 로드 (여러 워크시트 통합)
+
+        excel_file: 이미 조회한 엑셀 파일 정보 (주어지면 파일 목록 조회 생략)
+        """
         try:
             logger.info("📊 Teams에서 불량 데이터 로드 시작...")
             flush_log(logger)
 
-            # 1. Teams 파일 목록 조회
-            files = self._get_teams_files()
+            if excel_file is None:
+                # 1. Teams 파일 목록 조회
+                files = self._get_teams_files()
 
-            # 2. 엑셀 파일 찾기
-            excel_file = self._find_excel_file(files)
+                # 2. 엑셀 파일 찾기
+                excel_file = self._find_excel_file(files)
             if not excel_file:
                 raise Exception("대상 엑셀 파일을 찾을 수 없습니다")
 
@@ -90,6 +90,10 @@ class FactoryDefectPredictionSystem:
             )
             data["keyword_text"] = data["keywords"].apply(lambda x: " ".join(x))
 
+            # 고도화 분석기가 같은 데이터를 다시 로드하지 않도록 주입
+            # (모델 학습 시 data가 라벨 인코딩되므로 set_data는 원본 값을 복사해 보관)
+            self.advanced_analyzer.set_data(data, self.data_loader)
+
             # 3. 모델 로드 또는 학습
             logger.info("=" * 50)
             logger.info("3단계: ML 모델 준비")
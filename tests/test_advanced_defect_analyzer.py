@@ -0,0 +1,90 @@
+"""
+AdvancedDefectAnalyzer 회귀 테스트
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis.advanced_defect_analyzer import AdvancedDefectAnalyzer
+from ml.defect_predictor import DefectPredictor
+
+
+def make_defect_data(n: int = 40) -> pd.DataFrame:
+    """모델 학습과 부품별 집계에 필요한 컬럼을 갖춘 불량 데이터"""
+    parts = ["SPEED CONTROLLER", "LEAK SENSOR", "CLAMP / HEATING JACKET", "TOUCH SCREEN"]
+    return pd.DataFrame(
+        {
+            "제품명": np.resize(["GAIA-I", "GAIA-I DUAL", "DRAGON"], n),
+            "부품명": np.resize(parts, n),
+            "검출단계": np.resize(["가압검사", "제조품질"], n),
+            "대분류": np.resize(["부품불량", "기구작업불량", "전장작업불량", "부품불량"], n),
+            "중분류": np.resize(["누수", "조립불량"], n),
+            "keyword_text": np.resize(["누수 피팅", "체결 불량", "센서 불량", "클램프 누수"], n),
+        }
+    )
+
+
+def test_part_counts_survive_model_training():
+    """set_data로 주입한 데이터는 이후 모델 학습(라벨 인코딩)에 영향받지 않음"""
+    data = make_defect_data()
+    analyzer = AdvancedDefectAnalyzer()
+    analyzer.set_data(data)
+
+    DefectPredictor().train_model(data)
+    assert pd.api.types.is_integer_dtype(data["부품명"])
+
+    counts = analyzer._get_actual_defect_counts(
+        ["SPEED CONTROLLER", "LEAK SENSOR", "HEATING JACKET", "CLAMP"]
+    )
+    assert counts == {
+        "SPEED CONTROLLER": 10,
+        "LEAK SENSOR": 10,
+        "HEATING JACKET": 10,
+        "CLAMP": 10,
+    }
+
+    mapping = analyzer._get_dynamic_defect_type_mapping()
+    assert mapping["SPEED CONTROLLER"] == "부품불량"
+    assert mapping["LEAK SENSOR"] == "기구작업불량"
+    assert mapping["HEATING JACKET"] == "전장작업불량"
+
+
+def test_risk_levels_treat_nan_rate_as_low():
+    """예상불량률이 NaN이면 위험도는 LOW (경계값은 상위 구간)"""
+    predictions = [
+        {"부품": "A", "예상불량률": float("nan")},
+        {"부품": "B", "예상불량률": 0.5},
+        {"부품": "C", "예상불량률": 1},
+        {"부품": "D", "예상불량률": 5},
+        {"부품": "E", "예상불량률": 15},
+    ]
+    result = AdvancedDefectAnalyzer()._analyze_risk_levels(predictions)
+
+    levels = [item["risk_level"] for item in result["risk_levels"]]
+    assert levels == ["LOW", "LOW", "MEDIUM", "HIGH", "CRITICAL"]
+    assert result["distribution"] == {"LOW": 2, "MEDIUM": 1, "HIGH": 1, "CRITICAL": 1}
+
+
+def test_trend_direction_follows_event_rate():
+    """발생 간격이 일정하면 STABLE, 후반에 잦아지면 INCREASING, 드물어지면 DECREASING"""
+    analyzer = AdvancedDefectAnalyzer()
+    start = pd.Timestamp("2024-01-01 18:00")
+
+    def trend(hours) -> str:
+        dates = start + pd.to_timedelta(np.asarray(hours, dtype=float), unit="h")
+        return analyzer._calculate_trend_direction(pd.DataFrame({"날짜": dates}))
+
+    # 시작/끝이 부분 일자여도 일정한 발생률은 추세 아님
+    assert trend(np.arange(40) * 6) == "STABLE"
+    assert trend(np.arange(100)) == "STABLE"
+
+    # 전반 120시간에 5건, 후반 120시간에 20건 (시간을 뒤집으면 감소 추세)
+    hours = np.concatenate([np.arange(5) * 24, 120 + np.arange(1, 21) * 6])
+    assert trend(hours) == "INCREASING"
+    assert trend(hours.max() - hours) == "DECREASING"
+    assert trend(np.arange(5)) == "INSUFFICIENT_DATA"
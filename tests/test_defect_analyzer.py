@@ -0,0 +1,58 @@
+"""
+DefectAnalyzer 회귀 테스트
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sklearn.preprocessing import LabelEncoder
+
+from analysis.defect_analyzer import DefectAnalyzer
+
+
+def test_dashboard_cumulative_counts_follow_rate_buckets():
+    """누적 건수는 예상불량률 구간 범위 안에서 생성되고, NaN은 최하위 구간(5~14)"""
+    predictions = [
+        {"부품": "A", "예상불량률": float("nan")},
+        {"부품": "B", "예상불량률": 4},
+        {"부품": "C", "예상불량률": 5},
+        {"부품": "D", "예상불량률": 10},
+        {"부품": "E", "예상불량률": 20},
+    ]
+    ranges = [(5, 15), (5, 15), (10, 20), (20, 40), (40, 80)]
+
+    dashboard = DefectAnalyzer().create_dashboard_data(predictions, [], [], "")
+    counts = [pred["누적"] for pred in dashboard["predictions"]]
+    for count, (low, high) in zip(counts, ranges):
+        assert low <= count < high
+
+    # 같은 입력이면 같은 대시보드 데이터
+    again = DefectAnalyzer().create_dashboard_data(predictions, [], [], "")
+    assert [pred["누적"] for pred in again["predictions"]] == counts
+
+
+def test_production_weight_follows_in_place_weight_updates():
+    """같은 가중치 사전을 제자리 수정하면 캐시된 가중치가 아닌 새 값 반환"""
+    encoder = LabelEncoder().fit(["GAIA-I", "GAIA-I DUAL"])
+    label_encoders = {"제품명": encoder}
+    production_weights = {"GAIA-I": 0.3, "GAIA-I DUAL": 0.7}
+    code = int(encoder.transform(["GAIA-I"])[0])
+
+    analyzer = DefectAnalyzer()
+    assert (
+        analyzer._get_production_weight(code, production_weights, label_encoders) == 0.3
+    )
+
+    production_weights["GAIA-I"] = 0.5
+    assert (
+        analyzer._get_production_weight(code, production_weights, label_encoders) == 0.5
+    )
+
+    # 인코더를 다시 학습하면 바뀐 인코딩 순서로 다시 구성
+    encoder.fit(["GAIA-I DUAL", "GAIA-I", "AAA"])
+    code = int(encoder.transform(["GAIA-I"])[0])
+    assert (
+        analyzer._get_production_weight(code, production_weights, label_encoders) == 0.5
+    )